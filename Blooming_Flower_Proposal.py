@@ -1,5 +1,5 @@
 import turtle
-import time
+import math
 
 screen = turtle.Screen()
 screen.bgcolor("lightblue")
@@ -9,10 +9,8 @@ pen = turtle.Turtle()
 pen.speed(0)
 
 
-# Draw flower petals
+# Draw flower petals (colors are set once by the caller)
 def draw_petal(t, radius):
-    t.color("hotpink")
-    t.fillcolor("pink")
     t.begin_fill()
     t.circle(radius, 60)
     t.left(120)
@@ -22,42 +20,63 @@ def draw_petal(t, radius):
 
 
 # Draw complete flower
-def draw_flower(x, y, size):
-    pen.penup()
-    pen.goto(x, y)
-    pen.pendown()
+def draw_flower(t, x, y, size):
+    t.penup()
+    t.goto(x, y)
+    t.setheading(225)  # petals fan out from the lower-left leaf direction
+    t.pendown()
 
     # Draw 6 petals
+    t.color("hotpink")
+    t.fillcolor("pink")
     for _ in range(6):
-        draw_petal(pen, size)
-        pen.left(60)
+        draw_petal(t, size)
+        t.left(60)
 
     # Draw center
-    pen.color("gold")
-    pen.fillcolor("yellow")
-    pen.begin_fill()
-    pen.circle(size / 3)
-    pen.end_fill()
+    t.color("gold")
+    t.fillcolor("yellow")
+    t.begin_fill()
+    t.circle(size / 3)
+    t.end_fill()
+
+
+class ShapeRecorder(turtle.Turtle):
+    """Turtle that records each filled region as a compound-shape component instead of drawing it.
+
+    Each script here runs standalone, so this class is copied rather than
+    imported; keep it in sync with the one in Penguin_Sliding_Love_Story.py.
+    """
+
+    def __init__(self):
+        super().__init__(visible=False)
+        self.speed(0)
+        self.penup()
+        self.recorded = turtle.Shape("compound")
+
+    def pendown(self):
+        pass  # Never leave ink behind, only record
+
+    def begin_fill(self):
+        self.begin_poly()
+
+    def end_fill(self):
+        self.end_poly()
+        self.recorded.addcomponent(self.get_poly(), self.fillcolor(), self.pencolor())
 
 
 # Draw stem
+# Static scenery goes straight onto the Tk canvas as three items; pen.clear() leaves it alone
 def draw_stem(x, y):
-    pen.color("green")
-    pen.width(5)
-    pen.penup()
-    pen.goto(x, y)
-    pen.pendown()
-    pen.setheading(270)
-    pen.forward(150)
-
-    # Draw leaves
-    pen.setheading(225)
-    pen.circle(30, 90)
-    pen.penup()
-    pen.goto(x, y - 75)
-    pen.pendown()
-    pen.setheading(315)
-    pen.circle(-30, 90)
+    canvas = screen.getcanvas()
+    # Turtle (x, y) is canvas (x, -y)
+    canvas.create_line(x, -y, x, -(y - 150), fill="green", width=5, capstyle="round")
+
+    # Draw leaves: quarter circles of radius 30 hanging off the stem
+    offset = 30 * math.sqrt(0.5)
+    for cx, cy, start in ((x + offset, y - 150 - offset, 135), (x - offset, y - 75 - offset, -45)):
+        canvas.create_arc(cx - 30, -cy - 30, cx + 30, -cy + 30, start=start, extent=90,
+                          style="arc", outline="green", width=5)
 
 
 # Animate blooming
@@ -65,29 +84,53 @@ pen.hideturtle()
 draw_stem(0, -50)
 
 # Bloom animation (growing flower)
-for size in range(10, 70, 3):
-    pen.clear()
-    draw_stem(0, -50)
-    draw_flower(0, -50, size)
+# One frame per timer tick instead of sleeping, so Tk keeps handling events between frames
+BLOOM_SIZES = range(10, 70, 3)
+
+# Trace the fully bloomed flower once at the origin and register it as a shape;
+# every bloom frame then just rescales one turtle instead of re-tracing twelve arcs
+FULL_SIZE = BLOOM_SIZES[-1]
+recorder = ShapeRecorder()
+draw_flower(recorder, 0, 0, FULL_SIZE)
+screen.register_shape("flower", recorder.recorded)
+
+flower = turtle.Turtle(shape="flower", visible=False)
+flower.speed(0)
+flower.penup()
+flower.goto(0, -50)
+flower.setheading(90)  # Heading north maps shape coordinates 1:1 onto the screen
+
+
+def bloom(frame=0):
+    if frame >= len(BLOOM_SIZES):
+        screen.ontimer(show_message, 500)
+        return
+
+    scale = BLOOM_SIZES[frame] / FULL_SIZE
+    flower.shapesize(scale, scale, 5)
+    flower.showturtle()
     screen.update()
-    time.sleep(0.05)
-
-# Add proposal text
-time.sleep(0.5)
-pen.penup()
-pen.goto(0, 150)
-pen.color("darkred")
-pen.write("I LOVE YOU! 💕", align="center", font=("Comic Sans MS", 36, "bold"))
-
-pen.goto(0, 100)
-pen.color("purple")
-pen.write("Will You Be Mine Forever?", align="center", font=("Arial", 22, "italic"))
-
-# Add decorative hearts
-heart_pos = [(-150, 120), (150, 120), (-150, -180), (150, -180)]
-for pos in heart_pos:
-    pen.goto(pos)
-    pen.color("red")
-    pen.write("❤️", font=("Arial", 30, "normal"))
+    screen.ontimer(lambda: bloom(frame + 1), 50)
+
+
+def show_message():
+    # Add proposal text
+    pen.penup()
+    pen.goto(0, 150)
+    pen.color("darkred")
+    pen.write("I LOVE YOU! 💕", align="center", font=("Comic Sans MS", 36, "bold"))
+
+    pen.goto(0, 100)
+    pen.color("purple")
+    pen.write("Will You Be Mine Forever?", align="center", font=("Arial", 22, "italic"))
+
+    # Add decorative hearts
+    heart_pos = [(-150, 120), (150, 120), (-150, -180), (150, -180)]
+    for pos in heart_pos:
+        pen.goto(pos)
+        pen.color("red")
+        pen.write("❤️", font=("Arial", 30, "normal"))
+
 
+bloom()
 turtle.done()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import turtle
 import random
+import math
 import time
 
 screen = turtle.Screen()
@@ -7,37 +8,61 @@ screen.bgcolor("navy")
 screen.title("🎆 Surprise! 🎆")
 screen.tracer(0)
 
+FIREWORK_COLORS = ("red", "yellow", "orange", "pink", "cyan", "lime", "magenta")
+
+
+# Two shared pens instead of one turtle per particle:
+# sparks holds the live streaks and is cleared every frame,
+# embers keeps the final streak each particle leaves behind
+def make_pen():
+    pen = turtle.Turtle()
+    pen.hideturtle()
+    pen.speed(0)
+    pen.penup()
+    pen.pensize(2)
+    return pen
+
+
+sparks = make_pen()
+embers = make_pen()
+
 
 # Firework particle class
 class Particle:
     def __init__(self, x, y, color):
-        self.t = turtle.Turtle()
-        self.t.hideturtle()
-        self.t.speed(0)
-        self.t.penup()
-        self.t.goto(x, y)
-        self.t.color(color)
-        self.t.pensize(2)
+        self.x, self.y = x, y
+        self.color = color
         self.angle = random.randint(0, 360)
+        self.dx = math.cos(math.radians(self.angle))
+        self.dy = math.sin(math.radians(self.angle))
         self.speed = random.randint(5, 15)
         self.life = 30
 
     def move(self):
-        self.t.setheading(self.angle)
-        self.t.forward(self.speed)
+        self.x += self.dx * self.speed
+        self.y += self.dy * self.speed
         self.speed *= 0.95
         self.life -= 1
 
+    def draw(self, pen):
+        """Trace this particle's 2px streak with a shared pen and advance past it."""
+        pen.goto(self.x, self.y)
+        pen.color(self.color)
+        pen.pendown()
+        self.x += self.dx * 2
+        self.y += self.dy * 2
+        pen.goto(self.x, self.y)
+        pen.penup()
+
     def is_alive(self):
         return self.life > 0
 
 
 # Create fireworks
 def create_firework(x, y):
-    colors = ["red", "yellow", "orange", "pink", "cyan", "lime", "magenta"]
     particles = []
     for _ in range(30):
-        color = random.choice(colors)
+        color = random.choice(FIREWORK_COLORS)
         particles.append(Particle(x, y, color))
     return particles
 
@@ -53,13 +78,11 @@ for pos in firework_positions:
     # Animate particles
     for _ in range(30):
         screen.update()
+        sparks.clear()
         for particle in all_particles:
             if particle.is_alive():
-                particle.t.clear()
                 particle.move()
-                particle.t.pendown()
-                particle.t.forward(2)
-                particle.t.penup()
+                particle.draw(sparks if particle.is_alive() else embers)
         time.sleep(0.02)
 
 # Show message
@@ -1,44 +1,54 @@
 import turtle
 import time
+import random
 
 screen = turtle.Screen()
 screen.bgcolor("lavender")
 screen.title("💝 An Important Question 💝")
 screen.setup(width=800, height=600)
+# Draw each scene off-screen and show it with one screen.update()
+screen.tracer(0, 0)
+
+CONFETTI_COLORS = ("red", "yellow", "blue", "green", "orange", "pink")
 
 pen = turtle.Turtle()
 pen.hideturtle()
 pen.speed(0)
 
+# The question never changes between NO clicks, so it gets its own turtle:
+# clearing pen (buttons and hints) leaves these canvas items in place
+title_pen = turtle.Turtle()
+title_pen.hideturtle()
+title_pen.speed(0)
+
 # Draw question
-pen.penup()
-pen.goto(0, 200)
-pen.color("darkred")
-pen.write("Will You Be My Valentine?", align="center", font=("Arial", 32, "bold"))
+title_pen.penup()
+title_pen.goto(0, 200)
+title_pen.color("darkred")
+title_pen.write("Will You Be My Valentine?", align="center", font=("Arial", 32, "bold"))
+
+title_pen.goto(0, 150)
+title_pen.color("purple")
+title_pen.write("💕", align="center", font=("Arial", 50, "normal"))
+
+
+canvas = screen.getcanvas()
 
-pen.goto(0, 150)
-pen.color("purple")
-pen.write("💕", align="center", font=("Arial", 50, "normal"))
+
+def button_coords(x, y, width, height):
+    """Canvas coordinates of a button's rectangle and label (turtle (x, y) is canvas (x, -y))."""
+    return (x, -(y + height), x + width, -y), (x + width / 2 - 1, -(y + 20))
 
 
 # Draw buttons
+# Buttons are plain canvas items, so a NO click moves or resizes them in place
 def draw_button(x, y, width, height, color, text):
-    pen.penup()
-    pen.goto(x, y)
-    pen.pendown()
-    pen.fillcolor(color)
-    pen.begin_fill()
-    for _ in range(2):
-        pen.forward(width)
-        pen.left(90)
-        pen.forward(height)
-        pen.left(90)
-    pen.end_fill()
-
-    pen.penup()
-    pen.goto(x + width / 2, y + 20)
-    pen.color("white")
-    pen.write(text, align="center", font=("Arial", 24, "bold"))
+    """Create a button and return its (rectangle, label) canvas item ids."""
+    rect_xy, label_xy = button_coords(x, y, width, height)
+    rect = canvas.create_rectangle(*rect_xy, fill=color, outline="white")
+    label = canvas.create_text(*label_xy, text=text, anchor="s", fill="white",
+                               font=("Arial", 24, "bold"))
+    return rect, label
 
 
 # Initial button positions
@@ -47,13 +57,15 @@ no_x, no_y = 50, -50
 button_width = 150
 button_height = 60
 
-draw_button(yes_x, yes_y, button_width, button_height, "green", "YES ✓")
-draw_button(no_x, no_y, button_width, button_height, "red", "NO ✗")
+yes_button = draw_button(yes_x, yes_y, button_width, button_height, "green", "YES ✓")
+no_button = draw_button(no_x, no_y, button_width, button_height, "red", "NO ✗")
 
 
 # Click handlers
 def clicked_yes(x, y):
     pen.clear()
+    title_pen.clear()
+    canvas.delete(*yes_button, *no_button, hint)
     screen.bgcolor("pink")
 
     # Draw big heart
@@ -80,47 +92,49 @@ def clicked_yes(x, y):
     pen.write("You Made Me The Happiest!", align="center", font=("Arial", 20, "italic"))
 
     # Confetti
-    import random
     confetti = turtle.Turtle()
     confetti.hideturtle()
     confetti.speed(0)
-    colors = ["red", "yellow", "blue", "green", "orange", "pink"]
 
-    for _ in range(100):
-        confetti.penup()
-        confetti.goto(random.randint(-400, 400), random.randint(-300, 300))
-        confetti.color(random.choice(colors))
-        confetti.dot(random.randint(5, 15))
+    # Lay out all the confetti first, then draw it grouped by color
+    # so the pen color changes once per color instead of once per dot
+    # Each column comes from one batched random.choices call instead of 400 scalar draws
+    n = 100
+    pieces = sorted(zip(random.choices(CONFETTI_COLORS, k=n), random.choices(range(-400, 401), k=n),
+                        random.choices(range(-300, 301), k=n), random.choices(range(5, 16), k=n)))
+
+    confetti.penup()
+    current_color = None
+    for color, cx, cy, size in pieces:
+        if color != current_color:
+            confetti.color(color)
+            current_color = color
+        confetti.goto(cx, cy)
+        confetti.dot(size)
+
+    screen.update()
 
 
 def clicked_no(x, y):
     global no_x, no_y
-    import random
 
     # Move "NO" button to random position (dodge!)
-    pen.clear()
-    no_x = random.randint(-300, 200)
-    no_y = random.randint(-200, 200)
-
-    # Redraw everything
-    pen.goto(0, 200)
-    pen.color("darkred")
-    pen.write("Will You Be My Valentine?", align="center", font=("Arial", 32, "bold"))
-
-    pen.goto(0, 150)
-    pen.color("purple")
-    pen.write("💕", align="center", font=("Arial", 50, "normal"))
+    new_x = random.randint(-300, 200)
+    new_y = random.randint(-200, 200)
+    for item in no_button:
+        canvas.move(item, new_x - no_x, -(new_y - no_y))
+    no_x, no_y = new_x, new_y
 
     # Make YES button bigger!
     yes_width = button_width + 20
     yes_height = button_height + 10
-    draw_button(yes_x, yes_y, yes_width, yes_height, "green", "YES ✓")
-    draw_button(no_x, no_y, button_width, button_height, "red", "NO ✗")
+    rect_xy, label_xy = button_coords(yes_x, yes_y, yes_width, yes_height)
+    canvas.coords(yes_button[0], *rect_xy)
+    canvas.coords(yes_button[1], *label_xy)
 
-    # Hint message
-    pen.goto(0, -200)
-    pen.color("blue")
-    pen.write("Try clicking YES! 😊", align="center", font=("Arial", 18, "italic"))
+    # Hint message: retext the one hint item instead of writing a new one per click
+    canvas.itemconfig(hint, text="Try clicking YES! 😊", fill="blue", font=("Arial", 18, "italic"))
+    screen.update()
 
 
 # Set up click detection
@@ -135,8 +149,8 @@ def check_click(x, y):
 
 screen.onclick(check_click)
 
-pen.goto(0, -200)
-pen.color("gray")
-pen.write("Click a button!", align="center", font=("Arial", 16, "italic"))
+hint = canvas.create_text(-1, 200, text="Click a button!", anchor="s", fill="gray",
+                          font=("Arial", 16, "italic"))
+screen.update()
 
 turtle.done()
\ No newline at end of file
@@ -1,102 +1,109 @@
 import sys
+import os
 import socket
+import selectors
 import threading
 import json
 import time
 import pickle
+import heapq
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QTextEdit, QLineEdit, QPushButton,
                              QLabel, QGroupBox, QFrame)
-from PyQt5.QtCore import pyqtSignal, QThread, Qt
+from PyQt5.QtCore import pyqtSignal, QThread, QTimer, Qt
 
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
-from cryptography.hazmat.primitives import serialization, hashes
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives import hashes
 
 # --- Configuration ---
 HOST = '127.0.0.1'
 PORTS = [8001, 8002, 8003]  # The Relay Nodes
 DEST_PORT = 8004  # The Final Server
+RECV_BUFFER_SIZE = 64 * 1024  # One recv can drain several queued frames
+
+KEY_LEN = 32  # Raw X25519 public key size
+NONCE_LEN = 12  # AES-GCM nonce size
+HKDF_INFO = b'onion'
+LOG_FLUSH_MS = 50  # Log lines are batched into one QTextEdit append per interval
+FORWARD_DELAY = 1.0  # Visual delay (s) before a relay forwards a peeled packet
 
 
 # --- Cryptography Utils ---
 
 class CryptoUtils:
+    _pub_cache = {}  # node public key bytes -> parsed public key
+
     @staticmethod
-    def generate_rsa_keys():
-        """Generates Private/Public Key Pair."""
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048
-        )
-        public_key = private_key.public_key()
-
-        # Serialize Public Key to send to directory
-        pem_public = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo
-        )
-        return private_key, pem_public
+    def generate_keys():
+        """Generates an X25519 Private/Public Key Pair."""
+        private_key = X25519PrivateKey.generate()
+
+        # Raw 32-byte Public Key to send to directory
+        public_bytes = private_key.public_key().public_bytes_raw()
+        return private_key, public_bytes
+
+    @classmethod
+    def load_public_key(cls, node_public_bytes):
+        """Parses a node's public key once and reuses it afterwards."""
+        public_key = cls._pub_cache.get(node_public_bytes)
+        if public_key is None:
+            public_key = X25519PublicKey.from_public_bytes(node_public_bytes)
+            cls._pub_cache[node_public_bytes] = public_key
+        return public_key
 
     @staticmethod
-    def encrypt_layer(payload_bytes, node_public_pem):
+    def derive_key(shared_secret):
+        """Stretches an X25519 shared secret into a 256-bit AES key."""
+        return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=HKDF_INFO).derive(shared_secret)
+
+    @classmethod
+    def encrypt_layer(cls, payload_bytes, node_public_bytes):
         """
-        Hybrid Encryption:
-        1. Generate temporary AES Key (Fernet).
-        2. Encrypt Payload with AES.
-        3. Encrypt AES Key with Node's RSA Public Key.
-        4. Package: [RSA_Enc_AES_Key_Len (4 bytes)] + [RSA_Enc_AES_Key] + [AES_Enc_Payload]
+        Hybrid Encryption (ECDH):
+        1. Generate an ephemeral X25519 Key Pair.
+        2. Agree on a shared secret with the Node's Public Key and derive an AES Key (HKDF).
+        3. Encrypt Payload with AES-GCM.
+        4. Package: [Ephemeral_Public_Key (32 bytes)] + [Nonce (12 bytes)] + [AES_Enc_Payload]
+
+        Every layer gets its own ephemeral key, so packets stay unlinkable and
+        keep forward secrecy.
         """
-        # Load RSA Key
-        public_key = serialization.load_pem_public_key(node_public_pem)
+        # Load Node Key (cached per node)
+        public_key = cls.load_public_key(node_public_bytes)
 
-        # Generate AES Key
-        aes_key = Fernet.generate_key()
-        cipher_suite = Fernet(aes_key)
+        # Ephemeral Key Agreement -> AES Key
+        ephemeral_key = X25519PrivateKey.generate()
+        aes_key = cls.derive_key(ephemeral_key.exchange(public_key))
+        ephemeral_public = ephemeral_key.public_key().public_bytes_raw()
 
         # Encrypt Payload (AES)
-        encrypted_payload = cipher_suite.encrypt(payload_bytes)
-
-        # Encrypt AES Key (RSA)
-        encrypted_aes_key = public_key.encrypt(
-            aes_key,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None
-            )
-        )
-
-        # Pack Format: length_of_key_block (4 bytes int) + encrypted_key + encrypted_payload
-        key_len = len(encrypted_aes_key)
-        packet = key_len.to_bytes(4, 'big') + encrypted_aes_key + encrypted_payload
+        nonce = os.urandom(NONCE_LEN)
+        encrypted_payload = AESGCM(aes_key).encrypt(nonce, payload_bytes, None)
+
+        # Pack Format: ephemeral_public_key + nonce + encrypted_payload
+        packet = ephemeral_public + nonce + encrypted_payload
         return packet
 
-    @staticmethod
-    def decrypt_layer(packet_bytes, private_key):
+    @classmethod
+    def decrypt_layer(cls, packet_bytes, private_key):
         """
         Peels one layer of the onion.
         Returns: Decrypted Payload Bytes (which might contain the next onion layer).
         """
         try:
             # 1. Parse Packet
-            key_len = int.from_bytes(packet_bytes[:4], 'big')
-            encrypted_aes_key = packet_bytes[4: 4 + key_len]
-            encrypted_payload = packet_bytes[4 + key_len:]
-
-            # 2. Decrypt AES Key (RSA)
-            aes_key = private_key.decrypt(
-                encrypted_aes_key,
-                padding.OAEP(
-                    mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                    algorithm=hashes.SHA256(),
-                    label=None
-                )
-            )
+            ephemeral_public = packet_bytes[:KEY_LEN]
+            nonce = packet_bytes[KEY_LEN: KEY_LEN + NONCE_LEN]
+            encrypted_payload = packet_bytes[KEY_LEN + NONCE_LEN:]
+
+            # 2. Recover AES Key (ECDH with our Private Key)
+            peer_key = X25519PublicKey.from_public_bytes(ephemeral_public)
+            aes_key = cls.derive_key(private_key.exchange(peer_key))
 
             # 3. Decrypt Payload (AES)
-            cipher_suite = Fernet(aes_key)
-            decrypted_payload = cipher_suite.decrypt(encrypted_payload)
+            decrypted_payload = AESGCM(aes_key).decrypt(nonce, encrypted_payload, None)
 
             return decrypted_payload
         except Exception as e:
@@ -106,6 +113,34 @@ class CryptoUtils:
 
 # --- Networking Components ---
 
+def send_frame(sock, packet):
+    """Sends one packet prefixed with its 4-byte big-endian length."""
+    sock.sendall(len(packet).to_bytes(4, 'big') + packet)
+
+
+def open_connection(port):
+    """Opens a TCP connection with Nagle disabled so the header and payload leave immediately."""
+    s = socket.create_connection((HOST, port))
+    s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return s
+
+
+def send_persistent(conns, port, packet):
+    """
+    Sends a frame over a kept-alive connection from `conns` (port -> socket),
+    reconnecting once if the peer has dropped it.
+    """
+    s = conns.get(port)
+    if s is not None:
+        try:
+            send_frame(s, packet)
+            return
+        except (BrokenPipeError, ConnectionResetError):
+            s.close()
+    s = conns[port] = open_connection(port)
+    send_frame(s, packet)
+
+
 class NodeServer(QThread):
     """
     A Thread that acts as a Node/Server listening on a TCP port.
@@ -118,32 +153,95 @@ class NodeServer(QThread):
         self.name = name
         self.port = port
         self.is_destination = is_destination
-        self.private_key, self.public_key_pem = CryptoUtils.generate_rsa_keys()
+        self.private_key, self.public_key_bytes = CryptoUtils.generate_keys()
         self.running = True
 
+        # Persistent connections to next hops (port -> socket)
+        self._fwd_conns = {}
+
+        # Peeled packets waiting out the visual delay: heap of (deadline, port, packet)
+        self._fwd_queue = []
+
+        # Registered receive buffer shared by every connection of this node
+        self._recv_buf = bytearray(RECV_BUFFER_SIZE)
+        self._recv_view = memoryview(self._recv_buf)
+
     def run(self):
+        """Single event loop: multiplexes accept + per-connection reads with one selector."""
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.selector = selectors.DefaultSelector()
         try:
             self.sock.bind((HOST, self.port))
             self.sock.listen(5)
-            self.log_signal.emit(self.name, f"Listening on {self.port}...")
+            self.sock.setblocking(False)
+            self.selector.register(self.sock, selectors.EVENT_READ, data=None)
+        except OSError as e:
+            self.log_signal.emit(self.name, f"❌ Cannot listen on {self.port}: {e}")
+            self.shutdown()
+            return
+        self.log_signal.emit(self.name, f"Listening on {self.port}...")
 
+        try:
             while self.running:
-                conn, addr = self.sock.accept()
-                threading.Thread(target=self.handle_client, args=(conn,)).start()
-        except OSError:
-            pass
+                # Sleep no longer than the next queued forward is due
+                timeout = 0.5
+                if self._fwd_queue:
+                    timeout = min(timeout, max(0.0, self._fwd_queue[0][0] - time.monotonic()))
+
+                for key, _ in self.selector.select(timeout=timeout):
+                    if key.data is None:
+                        self.accept_client()
+                    else:
+                        self.handle_client(key.fileobj, key.data)
+                self.flush_forwards()
+        except OSError as e:
+            # stop() closing the listener is the expected way out; anything else is reported
+            if self.running:
+                self.log_signal.emit(self.name, f"❌ Event loop stopped: {e}")
+        finally:
+            self.shutdown()
 
-    def handle_client(self, conn):
+    def accept_client(self):
+        try:
+            conn, addr = self.sock.accept()
+        except BlockingIOError:
+            return
+        except OSError as e:
+            if self.running:
+                self.log_signal.emit(self.name, f"❌ Accept failed: {e}")
+            return
+        conn.setblocking(False)
+        # Per-connection bytes received but not yet forming a complete frame
+        self.selector.register(conn, selectors.EVENT_READ, data=bytearray())
+
+    def close_client(self, conn):
+        self.selector.unregister(conn)
+        conn.close()
+
+    def handle_client(self, conn, pending):
+        # One large recv per wake-up, then every complete length-prefixed frame is peeled off
+        try:
+            n = conn.recv_into(self._recv_view)
+        except BlockingIOError:
+            return
+        except ConnectionError:
+            n = 0
+        if n == 0:
+            self.close_client(conn)
+            return
+
+        pending += self._recv_view[:n]
+        while len(pending) >= 4:
+            length = int.from_bytes(pending[:4], 'big')
+            if len(pending) < 4 + length:
+                break
+            packet = bytes(pending[4:4 + length])
+            del pending[:4 + length]
+            self.process_packet(packet)
+
+    def process_packet(self, data):
         try:
-            # Receive Data (Chunks)
-            data = b""
-            while True:
-                chunk = conn.recv(4096)
-                if not chunk: break
-                data += chunk
-
             self.log_signal.emit(self.name, f"Received {len(data)} bytes encrypted blob.")
 
             # --- THE PEELING PROCESS ---
@@ -168,41 +266,76 @@ class NodeServer(QThread):
                     inner_packet = instructions['payload']
 
                     self.log_signal.emit(self.name, f"Layer Peeled. Next Hop -> Port {next_hop_port}")
-                    time.sleep(1)  # Visual delay
-                    self.forward_packet(next_hop_port, inner_packet)
+                    # Visual delay: the event loop forwards it once the deadline passes
+                    heapq.heappush(self._fwd_queue,
+                                   (time.monotonic() + FORWARD_DELAY, next_hop_port, inner_packet))
                 else:
                     self.log_signal.emit(self.name, "❌ Decryption/Routing Error.")
 
         except Exception as e:
             self.log_signal.emit(self.name, f"Error: {e}")
-        finally:
-            conn.close()
+
+    def flush_forwards(self):
+        now = time.monotonic()
+        while self._fwd_queue and self._fwd_queue[0][0] <= now:
+            _, next_port, packet = heapq.heappop(self._fwd_queue)
+            self.forward_packet(next_port, packet)
 
     def forward_packet(self, next_port, packet):
         try:
             self.log_signal.emit(self.name, f"Forwarding {len(packet)} bytes to {next_port}...")
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((HOST, next_port))
-            s.sendall(packet)
+            send_persistent(self._fwd_conns, next_port, packet)
+        except OSError as e:
+            # Drop the broken connection so the next packet to this hop reconnects
+            s = self._fwd_conns.pop(next_port, None)
+            if s is not None:
+                s.close()
+            if isinstance(e, ConnectionRefusedError):
+                self.log_signal.emit(self.name, f"❌ Failed to connect to {next_port}")
+            else:
+                self.log_signal.emit(self.name, f"❌ Failed to forward to {next_port}: {e}")
+
+    def shutdown(self):
+        for key in list(self.selector.get_map().values()):
+            key.fileobj.close()
+        self.selector.close()
+        self.sock.close()
+        for s in self._fwd_conns.values():
             s.close()
-        except ConnectionRefusedError:
-            self.log_signal.emit(self.name, f"❌ Failed to connect to {next_port}")
 
     def stop(self):
         self.running = False
-        self.sock.close()
+        # Closing the listener frees the port now; the loop cleans up the rest on its next wake-up
+        sock = getattr(self, 'sock', None)
+        if sock is not None:
+            sock.close()
 
 
 # --- GUI Application ---
 
 class OnionRouterSim(QMainWindow):
+    # Node label styles, selected by each label's "state" property
+    STATUS_QSS = (
+        'QLabel[state="listening"] { border: 2px solid #00ff00; border-radius: 5px; padding: 10px; color: white; }'
+        'QLabel[state="idle"] { border: 2px solid #555; color: gray; }'
+        'QLabel[state="active"] { border: 2px solid #00ff00; background-color: #003300; color: white; }'
+    )
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("The Onion Router Simulator (Tor Logic)")
         self.setGeometry(100, 100, 1000, 700)
         self.setStyleSheet("background-color: #1a1a1a; color: #00ff00; font-family: monospace;")
 
+        # Log batching: lines collect here and are flushed together by a single-shot timer
+        self._log_buf = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self.flush_log)
+
         self.nodes = {}  # Store node threads
+        self._client_conns = {}  # Kept-alive client connection to the entry node
         self.init_network()
         self.init_ui()
 
@@ -221,6 +354,9 @@ class OnionRouterSim(QMainWindow):
             self.nodes[name] = node
             node.start()
 
+        # Key directory: each node's public key, built once and looked up by port
+        self._pub_by_port = {port: self.nodes[name].public_key_bytes for name, port, _ in node_configs}
+
     def init_ui(self):
         central = QWidget()
         self.setCentralWidget(central)
@@ -234,12 +370,14 @@ class OnionRouterSim(QMainWindow):
 
         # Network Diagram (Status Area)
         diagram_box = QGroupBox("Network Status")
+        diagram_box.setStyleSheet(self.STATUS_QSS)
         diagram_layout = QHBoxLayout()
         self.status_labels = {}
+        self._active_label = None
 
         for name in self.nodes.keys():
             lbl = QLabel(f"[{name}]\nListening")
-            lbl.setStyleSheet("border: 2px solid #00ff00; border-radius: 5px; padding: 10px; color: white;")
+            lbl.setProperty("state", "listening")
             lbl.setAlignment(Qt.AlignCenter)
             diagram_layout.addWidget(lbl)
             self.status_labels[name] = lbl
@@ -274,76 +412,97 @@ class OnionRouterSim(QMainWindow):
         ctrl_layout.addWidget(btn_send)
         layout.addWidget(ctrl_box)
 
+    def append_log(self, line):
+        self._log_buf.append(line)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def flush_log(self):
+        if self._log_buf:
+            self.log_area.append("<br>".join(self._log_buf))
+            self._log_buf.clear()
+
+    @staticmethod
+    def set_label_state(lbl, state):
+        # Re-polish so the parent stylesheet's [state=...] selector is matched again
+        lbl.setProperty("state", state)
+        lbl.style().unpolish(lbl)
+        lbl.style().polish(lbl)
+
     def log_event(self, node_name, msg):
         timestamp = time.strftime("%H:%M:%S")
-        self.log_area.append(f"[{timestamp}] <b>{node_name}:</b> {msg}")
+        self.append_log(f"[{timestamp}] <b>{node_name}:</b> {msg}")
 
         # Highlight active node visually
-        # Reset all
-        for name, lbl in self.status_labels.items():
-            lbl.setStyleSheet("border: 2px solid #555; color: gray;")
+        # Reset the previously active label (all labels on the first event)
+        current = self.status_labels.get(node_name)
+        if current is not None and current is self._active_label:
+            return
+        stale = self.status_labels.values() if self._active_label is None else [self._active_label]
+        for lbl in stale:
+            if lbl is not current:
+                self.set_label_state(lbl, "idle")
 
         # Highlight current
-        if node_name in self.status_labels:
-            self.status_labels[node_name].setStyleSheet(
-                "border: 2px solid #00ff00; background-color: #003300; color: white;")
+        if current is not None:
+            self.set_label_state(current, "active")
+        self._active_label = current
 
     def client_send_message(self):
         msg = self.input_msg.text()
         if not msg: return
         self.input_msg.clear()
 
-        self.log_area.append(f"\n--- CLIENT: Constructing Onion Packet ---")
+        self.append_log("<br>--- CLIENT: Constructing Onion Packet ---")
 
         # --- THE ONION CONSTRUCTION (Layering) ---
         # Path: Client -> A -> B -> C -> Dest
 
         # 1. Layer 4: Final Message for Destination
         # Encrypt message with Destination's Public Key
-        dest_pub = self.nodes["Dest D"].public_key_pem
+        dest_pub = self._pub_by_port[DEST_PORT]
         layer_4 = CryptoUtils.encrypt_layer(msg.encode('utf-8'), dest_pub)
-        self.log_area.append("Client: Encrypted Layer 4 (Final Message) for Dest D")
+        self.append_log("Client: Encrypted Layer 4 (Final Message) for Dest D")
 
         # 2. Layer 3: Routing for Node C
         # Tells C to send 'layer_4' to Dest D (8004)
         c_payload = {'next_hop': DEST_PORT, 'payload': layer_4}
         c_bytes = pickle.dumps(c_payload)
-        c_pub = self.nodes["Node C"].public_key_pem
+        c_pub = self._pub_by_port[PORTS[2]]
         layer_3 = CryptoUtils.encrypt_layer(c_bytes, c_pub)
-        self.log_area.append("Client: Wrapped in Layer 3 (Routing Info) for Node C")
+        self.append_log("Client: Wrapped in Layer 3 (Routing Info) for Node C")
 
         # 3. Layer 2: Routing for Node B
         # Tells B to send 'layer_3' to Node C (8003)
         b_payload = {'next_hop': PORTS[2], 'payload': layer_3}
         b_bytes = pickle.dumps(b_payload)
-        b_pub = self.nodes["Node B"].public_key_pem
+        b_pub = self._pub_by_port[PORTS[1]]
         layer_2 = CryptoUtils.encrypt_layer(b_bytes, b_pub)
-        self.log_area.append("Client: Wrapped in Layer 2 (Routing Info) for Node B")
+        self.append_log("Client: Wrapped in Layer 2 (Routing Info) for Node B")
 
         # 4. Layer 1: Routing for Node A
         # Tells A to send 'layer_2' to Node B (8002)
         a_payload = {'next_hop': PORTS[1], 'payload': layer_2}
         a_bytes = pickle.dumps(a_payload)
-        a_pub = self.nodes["Node A"].public_key_pem
+        a_pub = self._pub_by_port[PORTS[0]]
         layer_1 = CryptoUtils.encrypt_layer(a_bytes, a_pub)
-        self.log_area.append("Client: Wrapped in Layer 1 (Routing Info) for Node A")
+        self.append_log("Client: Wrapped in Layer 1 (Routing Info) for Node A")
 
         # --- TRANSMIT ---
-        self.log_area.append("Client: Sending Onion Packet to Entry Node A...")
+        self.append_log("Client: Sending Onion Packet to Entry Node A...")
 
-        # Connect to Node A and send
+        # Send to Node A over the kept-alive connection
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            s.connect((HOST, PORTS[0]))
-            s.sendall(layer_1)
-            s.close()
+            send_persistent(self._client_conns, PORTS[0], layer_1)
         except Exception as e:
-            self.log_area.append(f"Client Error: {e}")
+            self.append_log(f"Client Error: {e}")
 
     def closeEvent(self, event):
         # Cleanup threads
         for node in self.nodes.values():
             node.stop()
+        for s in self._client_conns.values():
+            s.close()
         event.accept()
 
 
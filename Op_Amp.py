@@ -2,8 +2,9 @@ import numpy as np
 import matplotlib.pyplot as plt
 
 # --- Setup ---
-t = np.linspace(0, 0.05, 500) # Time: 0 to 50ms
-Vin = 1.0 * np.sin(2 * np.pi * 50 * t) # 1V Peak Input Sine Wave
+t = np.linspace(0, 0.05, 500, dtype=np.float32) # Time: 0 to 50ms
+Vin = np.multiply(t, 2 * np.pi * 50, dtype=np.float32)
+np.sin(Vin, out=Vin) # 1V Peak Input Sine Wave (computed in place)
 
 # --- Op-Amp Settings ---
 Gain = 10           # Try changing this to 5 or 20!
@@ -11,11 +12,12 @@ Supply_Pos = 8.0    # +Vcc
 Supply_Neg = -8.0   # -Vee
 
 # --- Calculation ---
-Vout_Ideal = Vin * Gain
+Vout_Ideal = np.empty_like(Vin)
+np.multiply(Vin, Gain, out=Vout_Ideal)
 
 # Apply Clipping (Saturation) Theory
 # If Vout > 8, make it 8. If Vout < -8, make it -8.
-Vout_Real = np.clip(Vout_Ideal, Supply_Neg, Supply_Pos)
+Vout_Real = np.clip(Vout_Ideal, Supply_Neg, Supply_Pos, out=np.empty_like(Vout_Ideal))
 
 # --- Plotting ---
 plt.figure("Op-Amp Clipping")
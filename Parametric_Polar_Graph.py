@@ -1,10 +1,13 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
+# 200 samples per curve are plenty at screen resolution; more points only overdraw
+N_SAMPLES = 200
+
 # Parametric curve: Lissajous figure
-t = np.linspace(0, 2 * np.pi, 500)
-x = np.sin(3 * t)
-y = np.sin(4 * t)
+t = np.linspace(0, 2 * np.pi, N_SAMPLES, dtype=np.float32)
+x = np.sin(3 * t, out=np.empty_like(t))
+y = np.sin(4 * t, out=np.empty_like(t))
 plt.figure()
 plt.plot(x, y)
 plt.title('Parametric Curve (Lissajous)')
@@ -14,9 +17,12 @@ plt.grid(True)
 plt.show()
 
 # Polar curve: r = 1 + 2*cos(theta)
-theta = np.linspace(0, 2 * np.pi, 500)
-r = 1 + 2 * np.cos(theta)
+theta = np.linspace(0, 2 * np.pi, N_SAMPLES, dtype=np.float32)
+r = np.cos(theta, out=np.empty_like(theta))
+r *= 2
+r += 1
 plt.figure()
-plt.polar(theta, r)
-plt.title('Polar Curve: r = 1 + 2*cos(theta)')
+ax = plt.subplot(projection='polar')
+ax.plot(theta, r, linewidth=1)
+ax.set_title('Polar Curve: r = 1 + 2*cos(theta)')
 plt.show()
\ No newline at end of file
@@ -127,13 +127,45 @@ def draw_penguin(t, x, y, size):
     t.end_fill()
 
 
-penguin1 = turtle.Turtle()
+class ShapeRecorder(turtle.Turtle):
+    """Turtle that records each filled region as a compound-shape component instead of drawing it.
+
+    Each script here runs standalone, so this class is copied rather than
+    imported; keep it in sync with the one in Blooming_Flower_Proposal.py.
+    """
+
+    def __init__(self):
+        super().__init__(visible=False)
+        self.speed(0)
+        self.penup()
+        self.recorded = turtle.Shape("compound")
+
+    def pendown(self):
+        pass  # Never leave ink behind, only record
+
+    def begin_fill(self):
+        self.begin_poly()
+
+    def end_fill(self):
+        self.end_poly()
+        self.recorded.addcomponent(self.get_poly(), self.fillcolor(), self.pencolor())
+
+
+# Trace the penguin once at the origin and register it as a shape,
+# so the animation only moves a turtle instead of redrawing every primitive
+recorder = ShapeRecorder()
+draw_penguin(recorder, 0, 0, 35)
+screen.register_shape("penguin", recorder.recorded)
+
+penguin1 = turtle.Turtle(shape="penguin", visible=False)
 penguin1.speed(0)
-penguin1.hideturtle()
+penguin1.penup()
+penguin1.setheading(90)  # Heading north maps shape coordinates 1:1 onto the screen
 
-penguin2 = turtle.Turtle()
+penguin2 = turtle.Turtle(shape="penguin", visible=False)
 penguin2.speed(0)
-penguin2.hideturtle()
+penguin2.penup()
+penguin2.setheading(90)
 
 # Draw ice/snow ground
 ice = turtle.Turtle()
@@ -156,26 +188,26 @@ ice.end_fill()
 screen.tracer(0)
 slide_positions = [(-350, -150), (-300, -150), (-250, -150), (-200, -150), (-150, -150)]
 
+penguin1.goto(slide_positions[0])
+penguin1.showturtle()
 for pos in slide_positions:
-    penguin1.clear()
-    draw_penguin(penguin1, pos[0], pos[1], 35)
+    penguin1.goto(pos)
     screen.update()
     time.sleep(0.2)
 
 # Second penguin
 slide_positions2 = [(350, -150), (300, -150), (250, -150), (200, -150), (150, -150)]
 
+penguin2.goto(slide_positions2[0])
+penguin2.showturtle()
 for pos in slide_positions2:
-    penguin2.clear()
-    draw_penguin(penguin2, pos[0], pos[1], 35)
+    penguin2.goto(pos)
     screen.update()
     time.sleep(0.2)
 
 # Final position
-penguin1.clear()
-penguin2.clear()
-draw_penguin(penguin1, -70, -150, 35)
-draw_penguin(penguin2, 70, -150, 35)
+penguin1.goto(-70, -150)
+penguin2.goto(70, -150)
 screen.update()
 
 time.sleep(0.5)
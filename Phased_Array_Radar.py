@@ -1,4 +1,5 @@
 import sys
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -7,9 +8,39 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QSlider, QLabel, QGroupBox, QCheckBox)
 from PyQt5.QtCore import QTimer, Qt
 
+# --- JIT Library ---
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("WARNING: Numba not found. Using the NumPy array factor.")
+
 
 # --- Physics Engine: Phased Array Beamforming ---
 
+def array_factor_kernel(sin_theta, N, k, d, theta0):
+    """
+    Normalized array factor as a scalar loop (closed-form Dirichlet kernel):
+    |AF| / N = |sin(N * delta / 2) / (N * sin(delta / 2))|
+    """
+    out = np.empty(sin_theta.size, np.float32)
+    s0 = math.sin(theta0)
+    for i in range(sin_theta.size):
+        delta = k * d * (sin_theta[i] - s0)
+        half = math.sin(delta / 2)
+        if abs(half) < 1e-9:
+            out[i] = 1.0  # All elements in phase (main lobe)
+        else:
+            out[i] = abs(math.sin(N * delta / 2) / (N * half))
+    return out
+
+
+if NUMBA_AVAILABLE:
+    array_factor_kernel = njit(cache=True, fastmath=True)(array_factor_kernel)
+
+
 class PhasedArrayPhysics:
     def __init__(self, num_elements=16):
         self.N = num_elements  # Number of antenna elements
@@ -19,35 +50,37 @@ class PhasedArrayPhysics:
         # Simulation Resolution
         self.theta_range = np.linspace(-np.pi / 2, np.pi / 2, 360)  # -90 to +90 degrees
 
+        # sin(theta) of the observation angles never changes, so build it once
+        self._sin_theta = np.sin(self.theta_range)
+
     def calculate_array_factor(self, steer_angle_deg):
         """
         Calculates the Radiation Pattern (Array Factor) for a specific steering angle.
 
         Math: AF(theta) = Sum( exp(j * (n * k * d * sin(theta) + beta_n)) )
         Where beta_n is the phase shift required to steer the beam.
+
+        With beta_n = -n * k * d * sin(theta0) the phase grows by the same step
+        delta = k * d * (sin(theta) - sin(theta0)) per element, so the sum is a
+        geometric series: AF = (1 - exp(j*N*delta)) / (1 - exp(j*delta)).
         """
         theta0 = np.radians(steer_angle_deg)
 
-        # 1. Calculate required phase shift (beta) per element to steer to theta0
-        # beta_n = -n * k * d * sin(theta0)
-        n = np.arange(self.N)
-        beta = -n * self.k * self.d * np.sin(theta0)
-
-        # 2. Calculate Array Factor for all observation angles (theta_range)
-        # We use broadcasting to do this efficiently without loops
-        # Dimensions: theta_grid (360, 1), n_grid (1, N)
-        theta_grid = self.theta_range[:, np.newaxis]
-        n_grid = n[np.newaxis, :]
+        if NUMBA_AVAILABLE:
+            return self.theta_range, array_factor_kernel(self._sin_theta, self.N, self.k, self.d, theta0)
 
-        # Argument of the exponential
-        psi = self.k * self.d * np.sin(theta_grid) * n_grid + beta
+        # 1. Phase step between neighbouring elements for every observation angle
+        delta = self.k * self.d * (self._sin_theta - np.sin(theta0))
+        step = np.exp(1j * delta)
 
-        # Sum across all elements (axis 1)
-        af_complex = np.sum(np.exp(1j * psi), axis=1)
+        # 2. Closed-form sum of the N element phasors (step == 1 at the main lobe sums to N)
+        near_lobe = np.abs(1 - step) < 1e-9
+        denom = np.where(near_lobe, 1, 1 - step)
+        af_complex = np.where(near_lobe, self.N, (1 - step ** self.N) / denom)
 
         # Normalize Magnitude (0 to 1) for plotting
         af_mag = np.abs(af_complex)
-        af_mag = af_mag / self.N
+        af_mag /= self.N
 
         return self.theta_range, af_mag
 
@@ -126,6 +159,10 @@ class RadarSimulator(QMainWindow):
         self.ax = self.fig.add_subplot(111, projection='polar')
         self.setup_plot()
 
+        # Blitting: the static axes are rendered once (and again on resize), frames only redraw the moving artists
+        self._bg = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
     def setup_plot(self):
         self.ax.set_facecolor('#001100')  # Radar Green/Black background
         self.ax.set_theta_zero_location("N")  # 0 degrees at top
@@ -141,19 +178,29 @@ class RadarSimulator(QMainWindow):
 
         # Plot Objects
         # 1. The Beam Pattern (Blue Line)
-        self.line_beam, = self.ax.plot([], [], color='#00FFFF', linewidth=2, label='Radar Beam')
+        self.line_beam, = self.ax.plot([], [], color='#00FFFF', linewidth=2, label='Radar Beam', animated=True)
 
         # 2. The Target (Red Dot)
-        self.plot_target, = self.ax.plot([], [], 'ro', markersize=10, label='Target')
+        self.plot_target, = self.ax.plot([], [], 'ro', markersize=10, label='Target', animated=True)
 
         # 3. Target Line (Red dashed line)
-        self.line_target, = self.ax.plot([], [], 'r--', linewidth=1, alpha=0.5)
+        self.line_target, = self.ax.plot([], [], 'r--', linewidth=1, alpha=0.5, animated=True)
 
         # Legend
         leg = self.ax.legend(loc='lower left', facecolor='#222', edgecolor='#555')
         for text in leg.get_texts():
             text.set_color("white")
 
+    def on_draw(self, event):
+        # Full redraw (first show / resize): recapture the static background
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.draw_animated()
+
+    def draw_animated(self):
+        self.ax.draw_artist(self.line_beam)
+        self.ax.draw_artist(self.plot_target)
+        self.ax.draw_artist(self.line_target)
+
     def manual_steer(self):
         self.steer_angle = self.slider_angle.value()
         self.lbl_angle.setText(f"Steering Angle: {self.steer_angle}°")
@@ -189,7 +236,12 @@ class RadarSimulator(QMainWindow):
         self.plot_target.set_data([target_rad], [0.95])  # Place target at edge
         self.line_target.set_data([target_rad, target_rad], [0, 1.0])
 
-        self.canvas.draw()
+        if self._bg is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._bg)
+        self.draw_animated()
+        self.canvas.blit(self.ax.bbox)
 
 
 if __name__ == "__main__":
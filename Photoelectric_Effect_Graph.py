@@ -6,8 +6,11 @@ e = 1.602e-19  # elementary charge
 work_function = 2.3 * e  # in Joules
 
 frequency = np.linspace(5e14, 1.2e15, 100)
-stopping_potential = (h * frequency - work_function) / e
-stopping_potential = np.maximum(stopping_potential, 0)
+stopping_potential = np.empty_like(frequency)
+np.multiply(h, frequency, out=stopping_potential)
+stopping_potential -= work_function
+np.clip(stopping_potential, 0, None, out=stopping_potential)
+stopping_potential /= e
 
 plt.plot(frequency, stopping_potential)
 plt.title('Photoelectric Effect')
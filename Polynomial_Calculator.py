@@ -1,5 +1,25 @@
 import numpy as np
 
+# Above this combined length FFT convolution beats np.polymul's direct O(n*m) convolution
+FFT_THRESHOLD = 128
+# Integer results are only taken from a float64 FFT while a bound on their
+# magnitude stays below this; the FFT round-off then stays far below 0.5
+FFT_EXACT_LIMIT = 2 ** 44
+
+def _next_pow2(n):
+    """Smallest power of two >= n."""
+    return 1 << (n - 1).bit_length()
+
+def _fft_convolve(a, b):
+    """Convolve two coefficient vectors with real FFTs (O(n log n))."""
+    out_len = len(a) + len(b) - 1
+    size = _next_pow2(out_len)
+    return np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:out_len]
+
+def _max_abs(a):
+    """Largest coefficient magnitude as a Python int (no int64 overflow)."""
+    return max(int(a.max()), -int(a.min())) if a.size else 0
+
 def add_polynomials(r1, q2):
     """Add two polynomials."""
     return np.polyadd(r1, q2)
@@ -9,9 +29,61 @@ def subtract_polynomials(a1, b2):
     return np.polysub(a1, b2)
 
 def multiply_polynomials(x1, y2):
-    """Multiply two polynomials."""
+    """Multiply two polynomials (FFT convolution for large degrees)."""
+    # Drop leading zeros like np.polymul does, so both paths return the same length
+    x1 = np.trim_zeros(np.asarray(x1), 'f')
+    y2 = np.trim_zeros(np.asarray(y2), 'f')
+    out_dtype = np.result_type(x1, y2)
+    if len(x1) == 0 or len(y2) == 0:
+        return np.zeros(1, dtype=out_dtype)
+    if len(x1) + len(y2) <= FFT_THRESHOLD:
+        return np.polymul(x1, y2)
+
+    if np.issubdtype(out_dtype, np.floating):
+        return _fft_convolve(x1, y2)
+
+    if np.issubdtype(out_dtype, np.integer):
+        # Exact only while every output coefficient is well inside float64's integer range
+        if _max_abs(x1) * _max_abs(y2) * min(len(x1), len(y2)) < FFT_EXACT_LIMIT:
+            # Round away the floating-point drift of the FFT
+            return np.rint(_fft_convolve(x1, y2)).astype(out_dtype)
+
+    # Complex, object (big-int) or too-large integer coefficients
     return np.polymul(x1, y2)
 
+def power_polynomial(p, n):
+    """Raise a polynomial to a non-negative integer power."""
+    if n < 0:
+        raise ValueError("Power must be a non-negative integer.")
+    p = np.trim_zeros(np.asarray(p), 'f')
+    if n == 0:
+        return np.array([1])
+    if len(p) == 0:
+        return np.array([0], dtype=p.dtype)  # The zero polynomial stays zero
+
+    out_len = n * (len(p) - 1) + 1
+    size = _next_pow2(out_len)
+    if np.issubdtype(p.dtype, np.floating):
+        # Every multiplication happens in the frequency domain: raise the spectrum to n once
+        return np.fft.irfft(np.fft.rfft(p, size) ** n, size)[:out_len]
+
+    # (max|p| * len(p))**n bounds every result coefficient; raising the spectrum to n
+    # also scales its relative round-off by n
+    if np.issubdtype(p.dtype, np.integer) and n * (_max_abs(p) * len(p)) ** n < FFT_EXACT_LIMIT:
+        result = np.fft.irfft(np.fft.rfft(p, size) ** n, size)[:out_len]
+        return np.rint(result).astype(p.dtype)
+
+    # Exact repeated squaring; each product still takes the FFT path when it is safe
+    result = np.array([1], dtype=p.dtype)
+    base = p
+    while True:
+        if n & 1:
+            result = multiply_polynomials(result, base)
+        n >>= 1
+        if not n:
+            return result
+        base = multiply_polynomials(base, base)
+
 def find_roots(p):
     """Find roots of a polynomial."""
     return np.roots(p)
@@ -39,5 +111,10 @@ if __name__ == "__main__":
     print_polynomial(subtract_polynomials(p1, p2))
     print("\nMultiplication:")
     print_polynomial(multiply_polynomials(p1, p2))
+    print("\nPower p(x)^3:")
+    print_polynomial(power_polynomial(p1, 3))
+    print("\nPower 0^3 and 0^0:")
+    print_polynomial(power_polynomial([0], 3))
+    print_polynomial(power_polynomial([0], 0))
     print("\nRoots of p(x):")
     print(find_roots(p1))
\ No newline at end of file
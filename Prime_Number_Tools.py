@@ -1,26 +1,81 @@
-def is_prime(n):
-    """Check if a number is prime."""
+import math
+import numpy as np
+
+# --- JIT Library ---
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when Numba is missing: run the kernels as plain Python."""
+        return lambda func: func
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47,
+                53, 59, 61, 67, 71, 73, 79, 83, 89, 97)
+# Mod-30 wheel: gaps between successive numbers coprime to 2, 3 and 5, starting from 7 (mod 30)
+WHEEL_GAPS = (4, 2, 4, 2, 4, 6, 2, 6)
+INT64_MAX = 2**63 - 1
+ISQRT_INT64_MAX = math.isqrt(INT64_MAX)  # Largest root whose square fits in int64
+
+def _is_prime_py(n):
+    """Trial division by small primes, then by mod-30 wheel candidates."""
     if n <= 1:
         return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
-        return False
-    for i in range(3, int(n**0.5)+1, 2):
-        if n % i == 0:
-            return False
-    return True
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    # Integer square root (float estimate, corrected); in int64 the estimate is capped
+    # so that squaring limit + 1 never wraps around
+    max_limit = ISQRT_INT64_MAX if n <= INT64_MAX else n
+    limit = min(int(math.sqrt(n)), max_limit)
+    while limit * limit > n:
+        limit -= 1
+    while limit < max_limit and (limit + 1) * (limit + 1) <= n:
+        limit += 1
+
+    # Trial divide by wheel candidates only (97 is 7 mod 30, so the wheel lines up from there)
+    i = SMALL_PRIMES[-1]
+    while True:
+        for gap in WHEEL_GAPS:
+            i += gap
+            if i > limit:
+                return True
+            if n % i == 0:
+                return False
+
+_is_prime_kernel = njit(cache=True)(_is_prime_py)
+
+@njit(cache=True)
+def _sieve_kernel(limit):
+    """Boolean Sieve of Eratosthenes: sieve[k] is True when k is prime."""
+    sieve = np.ones(limit + 1, dtype=np.bool_)
+    sieve[:2] = False
+    for i in range(2, int(math.sqrt(limit)) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = False
+    return sieve
+
+def is_prime(n):
+    """Check if a number is prime."""
+    n = int(n)
+    if n > INT64_MAX:
+        return _is_prime_py(n)  # Beyond the compiled kernel's int64 range
+    return _is_prime_kernel(n)
 
 def generate_primes(start, end):
-    """Generate a list of prime numbers in a given range."""
-    primes = []
-    for NUM in range(start, end + 1):
-        if is_prime(NUM):
-            primes.append(NUM)
-    return primes
+    """Generate a list of prime numbers in a given range (Sieve of Eratosthenes)."""
+    start, end = int(start), int(end)
+    if end < 2 or end < start:
+        return []
+    sieve = _sieve_kernel(end)
+    start = max(start, 0)
+    return (np.nonzero(sieve[start:])[0] + start).tolist()
 
 # Example usage:
 if __name__ == "__main__":
+    # Regression check: int64 inputs just below 2**63 used to overflow the square-root search
+    assert not is_prime(1000003 * 9223344366799)
+
     num = int(input("Enter a number to check if it is prime: "))
     if is_prime(num):
         print(f"{num} is a prime number.")
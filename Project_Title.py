@@ -21,12 +21,10 @@ pdf.ln(10) # Add a line break for spacing
 # Set font for the list items
 pdf.set_font("Arial", "", 12)
 
-# Loop through the list and add each title to the PDF
-for title in project_titles:
-    # Use multi_cell for titles that may wrap to multiple lines
-    # 10 is the height of each line, 0 is for full width, True for a new line after the cell
-    pdf.multi_cell(0, 10, title)
-    pdf.ln(2) # Add a small break between titles
+# Add all titles in a single multi_cell so the layout is computed in one pass
+# multi_cell still wraps long titles; 10 is the height of each line, 0 is for full width
+# The blank line between titles keeps a wrapped title from running into the next one
+pdf.multi_cell(0, 10, "\n\n".join(project_titles))
 
 # Save the PDF file
 output_filename = "project_titles.pdf"
@@ -10,9 +10,15 @@ theta = np.radians(angle)
 t_flight = 2 * v0 * np.sin(theta) / g
 t = np.linspace(0, t_flight, num=100)
 
-# Trajectory equations
-x = v0 * np.cos(theta) * t
-y = v0 * np.sin(theta) * t - 0.5 * g * t**2
+# Velocity components are constants: compute them once
+vx = v0 * np.cos(theta)
+vy = v0 * np.sin(theta)
+
+# Trajectory equations (y factored as t * (vy - g*t/2), evaluated in place)
+x = vx * t
+y = t * (-0.5 * g)
+y += vy
+y *= t
 
 plt.plot(x, y)
 plt.title('Projectile Motion')
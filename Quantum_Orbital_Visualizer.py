@@ -11,8 +11,105 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Path3DCollection
 from scipy.special import sph_harm, genlaguerre, factorial
+from functools import lru_cache
 import threading
+import math
+
+# --- Isosurface Library ---
+try:
+    from skimage.measure import marching_cubes
+
+    SKIMAGE_AVAILABLE = True
+except ImportError:
+    SKIMAGE_AVAILABLE = False
+    print("WARNING: scikit-image not found. Orbitals will be drawn as point clouds.")
+
+# --- JIT Library ---
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("WARNING: Numba not found. Using the NumPy orbital evaluation.")
+
+# Samples of the 1D radial table that R_nl is interpolated from
+RADIAL_TABLE_SIZE = 2048
+
+
+def _psi_octant_kernel(axis_half, r_table, R_table, Y_lm):
+    """
+    Fused octant evaluation: radius, linear interpolation of R_nl from the
+    uniform radial table and the product with Y_lm, in one sweep per point
+    """
+    n = axis_half.size
+    psi = np.empty((n, n, n), dtype=np.complex64)
+    dr = r_table[1] - r_table[0]
+    last = r_table.size - 1
+    for i in prange(n):
+        for j in range(n):
+            for k in range(n):
+                r = math.sqrt(axis_half[i] ** 2 + axis_half[j] ** 2 + axis_half[k] ** 2)
+                t = r / dr
+                idx = int(t)
+                if idx >= last:
+                    R_nl = R_table[last]
+                else:
+                    frac = t - idx
+                    R_nl = R_table[idx] * (1.0 - frac) + R_table[idx + 1] * frac
+                psi[i, j, k] = R_nl * Y_lm[i, j, k]
+    return psi
+
+
+if NUMBA_AVAILABLE:
+    _psi_octant_kernel = njit(parallel=True, fastmath=True, cache=True)(_psi_octant_kernel)
+
+
+@lru_cache(maxsize=64)
+def _radial_coeffs(n, l, a0):
+    """
+    Normalization constant and coefficients (ascending powers) of the Laguerre
+    polynomial L_{n-l-1}^{2l+1} for R_nl, built once per (n, l, a0) and reused across renders
+    """
+    fact_nl_cubed = float(factorial(n + l)) ** 3
+    norm = np.sqrt(
+        (2.0 / (n * a0)) ** 3 *
+        float(factorial(n - l - 1)) /
+        (2.0 * n * fact_nl_cubed)
+    )
+    return norm, genlaguerre(n - l - 1, 2 * l + 1).coef[::-1].copy()
+
+
+# Associated Legendre functions P_l^m(x) for l <= 3, m >= 0 (Condon-Shortley phase, as in scipy),
+# written in x = cos(theta) and s = sin(theta)
+_LEGENDRE = {
+    (0, 0): lambda x, s: np.ones_like(x),
+    (1, 0): lambda x, s: x,
+    (1, 1): lambda x, s: -s,
+    (2, 0): lambda x, s: 0.5 * (3 * x ** 2 - 1),
+    (2, 1): lambda x, s: -3 * x * s,
+    (2, 2): lambda x, s: 3 * s ** 2,
+    (3, 0): lambda x, s: 0.5 * (5 * x ** 3 - 3 * x),
+    (3, 1): lambda x, s: -1.5 * (5 * x ** 2 - 1) * s,
+    (3, 2): lambda x, s: 15 * x * s ** 2,
+    (3, 3): lambda x, s: -15 * s ** 3,
+}
+
+
+def _sph_harm_closed(l, m, theta, phi):
+    """
+    Closed-form Y_l^m for l <= 3 (s, p, d, f), matching scipy.special.sph_harm:
+    Y_l^m = sqrt((2l+1)/(4π) * (l-m)!/(l+m)!) * P_l^m(cos θ) * e^{imφ},
+    Y_l^{-m} = (-1)^m * conj(Y_l^m)
+    """
+    am = abs(m)
+    norm = math.sqrt((2 * l + 1) / (4 * math.pi) * math.factorial(l - am) / math.factorial(l + am))
+    Y_lm = norm * _LEGENDRE[(l, am)](np.cos(theta), np.sin(theta)) * np.exp(1j * am * phi)
+    if m < 0:
+        Y_lm = (-1) ** am * np.conj(Y_lm)
+    return Y_lm
 
 
 class QuantumOrbitalVisualizer:
@@ -29,6 +126,9 @@ class QuantumOrbitalVisualizer:
         self.psi_squared = None
         self.grid = None
 
+        # Angular factor per (l, m, grid_size, max_radius): re-renders at a new iso-value reuse it
+        self._angular_octant = lru_cache(maxsize=8)(self._compute_angular_octant)
+
     def radial_wavefunction(self, r, n, l):
         """
         Compute radial wavefunction R_nl(r) using Laguerre polynomials
@@ -39,26 +139,22 @@ class QuantumOrbitalVisualizer:
         a0 = self.a0
         rho = 2.0 * r / (n * a0)
 
-        # Normalization constant
-        norm = np.sqrt(
-            (2.0 / (n * a0)) ** 3 *
-            factorial(n - l - 1) /
-            (2.0 * n * factorial(n + l) ** 3)
-        )
-
-        # Generalized Laguerre polynomial L_{n-l-1}^{2l+1}
-        laguerre_poly = genlaguerre(n - l - 1, 2 * l + 1)
+        # Normalization constant and generalized Laguerre polynomial L_{n-l-1}^{2l+1} (cached)
+        norm, laguerre_coeffs = _radial_coeffs(n, l, a0)
 
-        # Radial wavefunction
-        R_nl = norm * np.exp(-rho / 2.0) * rho ** l * laguerre_poly(rho)
+        # Radial wavefunction (Laguerre evaluated by C-level Horner on the cached coefficients)
+        R_nl = norm * np.exp(-rho / 2.0) * rho ** l * np.polynomial.polynomial.polyval(rho, laguerre_coeffs)
 
         return R_nl
 
     def angular_wavefunction(self, theta, phi, l, m):
         """
         Compute angular wavefunction using spherical harmonics Y_l^m(theta, phi)
-        Uses scipy.special.sph_harm which returns Y_l^m
+        Closed form for l <= 3, otherwise scipy.special.sph_harm which returns Y_l^m
         """
+        if l <= 3:
+            return _sph_harm_closed(l, m, theta, phi)
+
         # Note: scipy uses Y_l^m(phi, theta) convention
         Y_lm = sph_harm(m, l, phi, theta)
         return Y_lm
@@ -80,26 +176,70 @@ class QuantumOrbitalVisualizer:
         # Create 3D grid in spherical coordinates
         max_radius = n ** 2 * 3  # Extend beyond most probable radius
 
-        # Cartesian grid
-        x = np.linspace(-max_radius, max_radius, grid_size)
-        y = np.linspace(-max_radius, max_radius, grid_size)
-        z = np.linspace(-max_radius, max_radius, grid_size)
+        # Cartesian grid (single precision: plenty for display, half the memory traffic)
+        x = y = z = self._axis(grid_size, max_radius)
+
+        # Only the octant x, y, z >= 0 is evaluated; the rest follows by symmetry
+        half = grid_size // 2
+        odd = grid_size % 2 == 1  # Odd grids hold the 0 plane, which the mirror must not duplicate
+
+        # Compute wavefunction
+        # R_nl depends only on r: tabulate it on a fine 1D grid and interpolate onto the 3D radii
+        r_table = np.linspace(0, max_radius * np.sqrt(3), RADIAL_TABLE_SIZE)
+        R_table = self.radial_wavefunction(r_table, n, l)
+        Y_lm = self._angular_octant(l, m, grid_size, max_radius)
+        if NUMBA_AVAILABLE:
+            psi_oct = _psi_octant_kernel(x[half:], r_table, R_table, Y_lm)
+        else:
+            R, _, _ = self._octant_spherical(x[half:])
+            R_nl = np.interp(R.ravel(), r_table, R_table).astype(np.float32).reshape(R.shape)
+            psi_oct = R_nl * Y_lm
+
+        # Reflections of psi = R(r) * P_l^m(cos θ) * e^{imφ}:
+        # x -> -x: φ -> π-φ gives (-1)^m conj(psi); y -> -y: φ -> -φ gives conj(psi);
+        # z -> -z: θ -> π-θ gives (-1)^(l+m) psi
+        psi = self._mirror(psi_oct, 0, odd, lambda a: (-1) ** m * np.conj(a))
+        psi = self._mirror(psi, 1, odd, np.conj)
+        psi = self._mirror(psi, 2, odd, lambda a: (-1) ** (l + m) * a)
+
+        self.psi = psi.astype(np.complex64, copy=False)
+        self.psi_squared = np.abs(self.psi) ** 2
+        # Broadcastable axis views (N,1,1), (1,N,1), (1,1,N) instead of three full meshgrid cubes
+        self.grid = (x.reshape(-1, 1, 1), y.reshape(1, -1, 1), z.reshape(1, 1, -1))
+
+        return self.psi_squared
 
-        X, Y, Z = np.meshgrid(x, y, z, indexing='ij')
+    @staticmethod
+    def _axis(grid_size, max_radius):
+        """Grid coordinates along one Cartesian axis"""
+        return np.linspace(-max_radius, max_radius, grid_size, dtype=np.float32)
+
+    @staticmethod
+    def _octant_spherical(axis_half):
+        """Spherical coordinates (R, Theta, Phi) of the octant spanned by a non-negative half axis"""
+        Xo, Yo, Zo = axis_half.reshape(-1, 1, 1), axis_half.reshape(1, -1, 1), axis_half.reshape(1, 1, -1)
 
         # Convert to spherical coordinates
-        R = np.sqrt(X ** 2 + Y ** 2 + Z ** 2)
+        R = np.sqrt(Xo ** 2 + Yo ** 2 + Zo ** 2)
         R[R == 0] = 1e-10  # Avoid division by zero
 
-        Theta = np.arccos(Z / R)
-        Phi = np.arctan2(Y, X)
+        Theta = np.arccos(Zo / R)
+        Phi = np.arctan2(Yo, Xo)
+        return R, Theta, Phi
 
-        # Compute wavefunction
-        self.psi = self.wavefunction(R, Theta, Phi, n, l, m)
-        self.psi_squared = np.abs(self.psi) ** 2
-        self.grid = (X, Y, Z)
+    def _compute_angular_octant(self, l, m, grid_size, max_radius):
+        """Y_l^m on the octant grid (cached through self._angular_octant)"""
+        axis = self._axis(grid_size, max_radius)
+        _, Theta, Phi = self._octant_spherical(axis[grid_size // 2:])
+        return self.angular_wavefunction(Theta, Phi, l, m).astype(np.complex64, copy=False)
 
-        return self.psi_squared
+    @staticmethod
+    def _mirror(half, axis, odd, reflect):
+        """Extend a non-negative half-axis array to the full axis using the reflection rule"""
+        lower = np.flip(half, axis=axis)
+        if odd:
+            lower = np.take(lower, np.arange(half.shape[axis] - 1), axis=axis)
+        return np.concatenate([reflect(lower), half], axis=axis)
 
     def get_orbital_name(self, n, l):
         """Convert quantum numbers to orbital name"""
@@ -252,9 +392,14 @@ class OrbitalVisualizerGUI:
         self.ax.set_zlabel('Z (Bohr radii)')
         self.ax.set_title('Quantum Orbital')
 
-        # Initial placeholder
-        self.ax.text(0.5, 0.5, 0.5, 'Click "Render Orbital" to begin',
-                     ha='center', va='center', fontsize=14, transform=self.ax.transAxes)
+        # Initial placeholder, reused for status messages between renders
+        self._message = self.ax.text(0.5, 0.5, 0.5, 'Click "Render Orbital" to begin',
+                                     ha='center', va='center', fontsize=14,
+                                     transform=self.ax.transAxes)
+
+        # Orbital artist (scatter or isosurface) and its colorbar, updated in place
+        self._orbital_artist = None
+        self._colorbar = None
 
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
         self.canvas.draw()
@@ -344,8 +489,6 @@ class OrbitalVisualizerGUI:
 
     def _plot_orbital(self, psi_squared, iso_value):
         """Plot the 3D isosurface"""
-        self.ax.clear()
-
         X, Y, Z = self.visualizer.grid
 
         # Normalize for better visualization
@@ -354,22 +497,57 @@ class OrbitalVisualizerGUI:
         # Find isosurface points
         mask = psi_norm > iso_value
 
-        if np.sum(mask) == 0:
-            self.ax.text(0.5, 0.5, 0.5, 'No points above threshold\nTry lower iso-value',
-                         ha='center', va='center', fontsize=12, transform=self.ax.transAxes)
+        if not mask.any():
+            self._remove_orbital_artist()
+            self._message.set_text('No points above threshold\nTry lower iso-value')
+            self._message.set_fontsize(12)
+            self._message.set_visible(True)
+        elif SKIMAGE_AVAILABLE and psi_norm.min() < iso_value:
+            # True isosurface: triangulate |ψ|² = iso with marching cubes
+            spacing = (X[1, 0, 0] - X[0, 0, 0], Y[0, 1, 0] - Y[0, 0, 0], Z[0, 0, 1] - Z[0, 0, 0])
+            verts, faces, _, _ = marching_cubes(psi_norm, level=iso_value, spacing=spacing)
+            verts += (X.min(), Y.min(), Z.min())
+            facecolor = plt.get_cmap('viridis')(iso_value)
+
+            self._message.set_visible(False)
+            if isinstance(self._orbital_artist, Poly3DCollection):
+                self._orbital_artist.set_verts(verts[faces])
+                self._orbital_artist.set_facecolor(facecolor)
+            else:
+                self._remove_orbital_artist()
+                self._orbital_artist = Poly3DCollection(verts[faces], alpha=0.6,
+                                                        facecolor=facecolor,
+                                                        edgecolor='none')
+                self.ax.add_collection3d(self._orbital_artist)
         else:
             # Plot points as scatter (simplified - could use marching cubes for true surface)
             # Downsample for performance
+            # One pass over the mask for the kept flat indices, then small gathers from the 1D axes
             step = max(1, self.visualizer.grid_size // 30)
-            x_plot = X[mask][::step]
-            y_plot = Y[mask][::step]
-            z_plot = Z[mask][::step]
-            c_plot = psi_norm[mask][::step]
-
-            scatter = self.ax.scatter(x_plot, y_plot, z_plot, c=c_plot,
-                                      cmap='viridis', alpha=0.6, s=2)
-            self.fig.colorbar(scatter, ax=self.ax, label='|ψ|² (normalized)',
-                              shrink=0.6, pad=0.1)
+            idx = np.flatnonzero(mask)[::step]
+            xi, yi, zi = np.unravel_index(idx, mask.shape)
+            x_plot = X.ravel()[xi]
+            y_plot = Y.ravel()[yi]
+            z_plot = Z.ravel()[zi]
+            c_plot = psi_norm.ravel()[idx]
+
+            self._message.set_visible(False)
+            if isinstance(self._orbital_artist, Path3DCollection):
+                # Reuse the scatter: swap its points and colors in place
+                self._orbital_artist._offsets3d = (x_plot, y_plot, z_plot)
+                self._orbital_artist.set_array(c_plot)
+                self._orbital_artist.autoscale()
+            else:
+                self._remove_orbital_artist()
+                self._orbital_artist = self.ax.scatter(x_plot, y_plot, z_plot, c=c_plot,
+                                                       cmap='viridis', alpha=0.6, s=2)
+
+            if self._colorbar is None:
+                self._colorbar = self.fig.colorbar(self._orbital_artist, ax=self.ax,
+                                                   label='|ψ|² (normalized)',
+                                                   shrink=0.6, pad=0.1)
+            else:
+                self._colorbar.update_normal(self._orbital_artist)
 
         # Labels
         name = self.visualizer.get_orbital_name(self.n_var.get(), self.l_var.get())
@@ -391,9 +569,18 @@ class OrbitalVisualizerGUI:
         self.ax.set_ylim(mid_y - max_range, mid_y + max_range)
         self.ax.set_zlim(mid_z - max_range, mid_z + max_range)
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.progress_var.set(100)
 
+    def _remove_orbital_artist(self):
+        """Detach the current orbital artist and its colorbar from the axes"""
+        if self._orbital_artist is not None:
+            self._orbital_artist.remove()
+            self._orbital_artist = None
+        if self._colorbar is not None:
+            self._colorbar.remove()
+            self._colorbar = None
+
     def _render_complete(self):
         """Called when rendering completes"""
         self.is_computing = False
@@ -440,16 +627,18 @@ class OrbitalVisualizerGUI:
         axes[1, 0].set_ylabel('Z')
 
         # Radial probability
-        r_max = int(np.sqrt(X ** 2 + Y ** 2 + Z ** 2).max())
+        r_values = np.sqrt(X ** 2 + Y ** 2 + Z ** 2).ravel()
+        r_max = int(r_values.max())
         r_bins = np.linspace(0, r_max, 100)
-        r_values = np.sqrt(X ** 2 + Y ** 2 + Z ** 2).flatten()
-        psi_values = psi_sq.flatten()
-
-        radial_prob = np.zeros(len(r_bins) - 1)
-        for i in range(len(r_bins) - 1):
-            mask = (r_values >= r_bins[i]) & (r_values < r_bins[i + 1])
-            if np.sum(mask) > 0:
-                radial_prob[i] = np.mean(psi_values[mask]) * r_bins[i] ** 2
+        psi_values = psi_sq.ravel()
+
+        # Mean |ψ|² per radial shell in one pass: bin index per point, then weighted counts
+        n_bins = len(r_bins) - 1
+        idx = np.digitize(r_values, r_bins) - 1
+        valid = (idx >= 0) & (idx < n_bins)
+        sums = np.bincount(idx[valid], weights=psi_values[valid], minlength=n_bins)
+        counts = np.bincount(idx[valid], minlength=n_bins)
+        radial_prob = sums / np.maximum(counts, 1) * r_bins[:-1] ** 2
 
         axes[1, 1].plot(r_bins[:-1], radial_prob, 'b-', linewidth=2)
         axes[1, 1].set_title('Radial Probability Distribution')
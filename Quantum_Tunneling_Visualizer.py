@@ -2,7 +2,28 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from scipy.sparse import diags
-from scipy.sparse.linalg import splu
+from scipy.linalg.lapack import zgttrf, zgttrs
+import scipy.fft
+
+# --- GPU Library ---
+try:
+    import cupy as cp
+    from cupyx.scipy.sparse import csr_matrix as gpu_csr_matrix
+    from cupyx.scipy.sparse.linalg import splu as gpu_splu
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+    print("WARNING: CuPy not found. Time evolution runs on the CPU.")
+
+# --- JIT Library ---
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("WARNING: Numba not found. Using the SciPy sparse matvec.")
 
 # --- Configuration ---
 # System Parameters (Atomic Units: hbar=1, m=1)
@@ -14,6 +35,26 @@ DX = L / N  # Spatial step size
 DT = 0.05  # Time step size
 FRAMES = 400  # Animation frames
 STEPS_PER_FRAME = 5  # Physics steps per animation frame
+# Time propagator: "crank-nicolson" (sparse, hard walls) or "split-operator" (FFT, padded periodic box)
+PROPAGATOR = "crank-nicolson"
+# Free-space points added on each side of the split-operator box, so the
+# reflected packet cannot wrap around into the transmitted region
+SPLIT_PAD = N
+
+
+
+def csr_matvec(data, indices, indptr, x, out):
+    """out = A @ x for a CSR matrix given by (data, indices, indptr)"""
+    for i in range(out.shape[0]):
+        acc = 0j
+        for jj in range(indptr[i], indptr[i + 1]):
+            acc += data[jj] * x[indices[jj]]
+        out[i] = acc
+    return out
+
+
+if NUMBA_AVAILABLE:
+    csr_matvec = njit(cache=True, fastmath=True)(csr_matvec)
 
 # --- Initialization ---
 x = np.linspace(0, L, N)
@@ -68,7 +109,67 @@ A_explicit = I - cn_factor * H  # Right side matrix (just multiplication)
 
 # Pre-compute the LU decomposition of the implicit matrix for fast solving
 # This is crucial for performance.
-solve_A = splu(A_implicit).solve
+if PROPAGATOR == "crank-nicolson":
+    if CUPY_AVAILABLE:
+        # Keep both operators on the GPU next to psi
+        A_explicit = gpu_csr_matrix(A_explicit.tocsr())
+        solve_A = gpu_splu(gpu_csr_matrix(A_implicit.tocsr())).solve
+    else:
+        # A_implicit is exactly tridiagonal: factor its three diagonals once with
+        # LAPACK's O(N) tridiagonal LU instead of a general sparse LU
+        lu_dl, lu_d, lu_du, lu_du2, ipiv, _ = zgttrf(cn_factor * off_diag,
+                                                     1 + cn_factor * main_diag,
+                                                     cn_factor * off_diag)
+
+        def solve_A(b):
+            # Solve in place: b is always a scratch RHS, so no new psi is allocated per step
+            return zgttrs(lu_dl, lu_d, lu_du, lu_du2, ipiv, b, overwrite_b=1)[0]
+
+        if NUMBA_AVAILABLE:
+            # Raw CSR arrays for the JIT matvec, and two RHS buffers reused every step
+            # (psi ends up in one after the in-place solve, the matvec writes the other)
+            A_explicit_csr = A_explicit.tocsr()
+            A_data, A_indices, A_indptr = A_explicit_csr.data, A_explicit_csr.indices, A_explicit_csr.indptr
+            rhs_buffers = (np.empty(N, dtype=np.complex128), np.empty(N, dtype=np.complex128))
+
+# --- Split-Operator Setup ---
+# psi(t+dt) = exp(-iV dt/2) IFFT[exp(-iT(k) dt) FFT[exp(-iV dt/2) psi]]
+# Two FFTs and two elementwise products per step, no linear solve.
+# The FFT box is periodic, so it runs on the domain padded with SPLIT_PAD
+# points of free space per side; only [0, L] is plotted.
+xp = cp if CUPY_AVAILABLE else np
+fft_backend = cp.fft if CUPY_AVAILABLE else scipy.fft
+
+if PROPAGATOR == "split-operator":
+    N_SPLIT = N + 2 * SPLIT_PAD
+    k = 2 * np.pi * np.fft.fftfreq(N_SPLIT, d=DX)
+    expT = xp.asarray(np.exp(-1j * HBAR * k * k / (2 * MASS) * DT))
+    expV_half = xp.asarray(np.exp(-1j * np.pad(V, SPLIT_PAD) / (2 * HBAR) * DT))
+    expV = expV_half * expV_half
+    psi = np.pad(psi, SPLIT_PAD)
+    visible_slice = slice(SPLIT_PAD, SPLIT_PAD + N)
+else:
+    visible_slice = slice(None)
+
+if CUPY_AVAILABLE:
+    # psi stays resident on the GPU; only |psi|^2 comes back per frame
+    psi = cp.asarray(psi, dtype=cp.complex128)
+
+
+def split_operator_steps(psi, steps):
+    """Advance psi by `steps` Strang splitting steps.
+
+    Consecutive half potential kicks between kinetic steps are fused into one
+    full kick, so only the first and last kick use expV_half.
+    """
+    psi = psi * expV_half
+    for step in range(steps):
+        psi_k = fft_backend.fft(psi)
+        psi_k *= expT
+        psi = fft_backend.ifft(psi_k)
+        psi *= expV if step < steps - 1 else expV_half
+    return psi
+
 
 # --- Visualization Setup ---
 fig, ax = plt.subplots(figsize=(10, 6))
@@ -101,45 +202,72 @@ status_text = ax.text(0.02, 0.85, "Tunneling Status: Approaching", transform=ax.
 
 ax.legend(loc='upper right')
 
+# Host buffers reused every frame: |psi|^2 and the imaginary-part scratch
+prob_density = np.empty(N, dtype=np.float64)
+imag_sq = np.empty(N, dtype=np.float64)
+# Grid points of psi to the right of the barrier centre (including any right padding)
+right_slice = slice(np.searchsorted(x, V_CENTER, side='right') + (visible_slice.start or 0), None)
+# Fill polygon outline: density along x, then back along the axis at zero
+fill_verts = np.zeros((2 * N, 2))
+fill_verts[:N, 0] = x
+fill_verts[N:, 0] = x[::-1]
+
 
 def init():
     line_prob.set_data([], [])
-    return line_prob, status_text
+    # Flat outline to start from; update() only rewrites its upper edge
+    fill_prob.set_verts([fill_verts])
+    return line_prob, fill_prob, status_text
 
 
 def update(frame):
-    global psi, fill_prob
+    global psi
 
     # Evolve the system multiple small steps for every animation frame
-    for _ in range(STEPS_PER_FRAME):
-        # 1. Calculate RHS: b = A_explicit * psi
-        b = A_explicit.dot(psi)
-        # 2. Solve LHS: A_implicit * psi_new = b
-        psi = solve_A(b)
-
-    # Calculate Probability Density: |psi|^2
-    # psi is complex, so we take abs()**2
-    prob_density = np.abs(psi) ** 2
+    if PROPAGATOR == "split-operator":
+        psi = split_operator_steps(psi, STEPS_PER_FRAME)
+    else:
+        for _ in range(STEPS_PER_FRAME):
+            # 1. Calculate RHS: b = A_explicit * psi
+            if NUMBA_AVAILABLE and not CUPY_AVAILABLE:
+                rhs = rhs_buffers[1] if psi is rhs_buffers[0] else rhs_buffers[0]
+                b = csr_matvec(A_data, A_indices, A_indptr, psi, rhs)
+            else:
+                b = A_explicit.dot(psi)
+            # 2. Solve LHS: A_implicit * psi_new = b
+            psi = solve_A(b)
+
+    # Transmitted probability, taken before cropping so padded free space still counts
+    psi_right = psi[right_slice]
+    prob_right = float((psi_right.real * psi_right.real + psi_right.imag * psi_right.imag).sum()) * DX
+
+    # Calculate Probability Density: |psi|^2 over the plotted domain
+    # re^2 + im^2 directly, skipping the sqrt inside abs() and its temporary
+    psi_vis = psi[visible_slice]
+    if CUPY_AVAILABLE:
+        # Single device -> host copy per frame, for plotting
+        (psi_vis.real * psi_vis.real + psi_vis.imag * psi_vis.imag).get(out=prob_density)
+    else:
+        np.multiply(psi_vis.real, psi_vis.real, out=prob_density)
+        np.add(prob_density, np.multiply(psi_vis.imag, psi_vis.imag, out=imag_sq), out=prob_density)
 
     # Update Line
     line_prob.set_data(x, prob_density)
 
-    # Update Fill (requires removing old collection and adding new one)
-    fill_prob.remove()
-    fill_prob = ax.fill_between(x, 0, prob_density, color='cyan', alpha=0.3)
+    # Update Fill in place on the existing PolyCollection
+    fill_verts[:N, 1] = prob_density
+    fill_prob.set_verts([fill_verts])
 
     # Simple status logic
-    total_prob = np.sum(prob_density * DX)
-    prob_right = np.sum(prob_density[x > V_CENTER] * DX)
-
+    # Both propagators are unitary, so the total probability stays 1
     if prob_right > 0.01:
-        status_text.set_text(f"Tunneling Status: Transmission {(prob_right / total_prob) * 100:.1f}%")
+        status_text.set_text(f"Tunneling Status: Transmission {prob_right * 100:.1f}%")
     else:
         status_text.set_text("Tunneling Status: Impact/Reflection")
 
     return line_prob, fill_prob, status_text
 
 
-ani = FuncAnimation(fig, update, frames=FRAMES, init_func=init, interval=30, blit=False)
+ani = FuncAnimation(fig, update, frames=FRAMES, init_func=init, interval=30, blit=True)
 plt.title("Quantum Tunneling: Time-Dependent Schrödinger Equation", color='white')
 plt.show()
\ No newline at end of file
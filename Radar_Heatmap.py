@@ -1,10 +1,10 @@
 import sys
 import io
-import random
+import json
 import datetime
-import pandas as pd
+from dataclasses import dataclass
 import numpy as np
-from sklearn.cluster import KMeans
+from scipy.cluster.vq import kmeans2
 import folium
 from folium.plugins import HeatMap, MousePosition
 
@@ -17,6 +17,18 @@ from PyQt5.QtCore import Qt
 
 # --- 1. Mock Data Generator ---
 
+@dataclass
+class RadarData:
+    """Radar detections as parallel arrays, one entry per detection."""
+    lat: np.ndarray
+    lon: np.ndarray
+    ts: np.ndarray  # datetime64[us]
+    hours: np.ndarray  # hours before generation time
+
+    def __len__(self):
+        return len(self.hours)
+
+
 class DataGenerator:
     @staticmethod
     def generate_mock_data(num_points=500):
@@ -28,7 +40,7 @@ class DataGenerator:
         base_lat = 48.0
         base_lon = 37.0
 
-        data = []
+        rng = np.random.default_rng()
         now = datetime.datetime.now()
 
         # Define 3 Battery Locations (Lat, Lon)
@@ -38,57 +50,63 @@ class DataGenerator:
             (base_lat + 0.08, base_lon - 0.02)
         ]
 
-        for _ in range(num_points):
-            # 80% chance to come from a battery (Cluster), 20% random noise
-            if random.random() < 0.8:
-                center = random.choice(batteries)
-                # Add Gaussian noise (firing dispersion error)
-                lat = center[0] + np.random.normal(0, 0.005)
-                lon = center[1] + np.random.normal(0, 0.005)
-            else:
-                # Random noise across the sector
-                lat = base_lat + random.uniform(-0.1, 0.1)
-                lon = base_lon + random.uniform(-0.1, 0.1)
+        # 80% chance to come from a battery (Cluster), 20% random noise
+        is_battery = rng.random(num_points) < 0.8
+        centers = np.array(batteries)[rng.integers(0, len(batteries), num_points)]
 
-            # Random timestamp within last 24 hours
-            hours_ago = random.uniform(0, 24)
-            ts = now - datetime.timedelta(hours=hours_ago)
+        # Battery hits get Gaussian noise (firing dispersion error),
+        # noise hits are spread uniformly across the sector
+        lat = np.where(is_battery,
+                       centers[:, 0] + rng.normal(0, 0.005, num_points),
+                       base_lat + rng.uniform(-0.1, 0.1, num_points))
+        lon = np.where(is_battery,
+                       centers[:, 1] + rng.normal(0, 0.005, num_points),
+                       base_lon + rng.uniform(-0.1, 0.1, num_points))
 
-            data.append({
-                'Latitude': lat,
-                'Longitude': lon,
-                'Timestamp': ts,
-                'Hours_Ago': hours_ago
-            })
+        # Random timestamp within last 24 hours
+        hours_ago = rng.uniform(0, 24, num_points)
+        ts = np.datetime64(now, 'us') - (hours_ago * 3.6e9).astype('timedelta64[us]')
 
-        return pd.DataFrame(data)
+        return RadarData(lat=lat, lon=lon, ts=ts, hours=hours_ago)
 
 
 # --- 2. Analytics Engine ---
 
 class IntelAnalyst:
-    def __init__(self, df):
-        self.df = df
-        self.filtered_df = df
+    def __init__(self, data):
+        self.data = data
         self.clusters = []
 
+        # Coordinate pairs for the hot paths, stacked once at ingest and sorted
+        # by age so every time window is a prefix
+        order = np.argsort(data.hours)
+        self._coords = np.column_stack([data.lat, data.lon])[order]
+        self._hours = data.hours[order]
+        self.filtered_coords = self._coords
+        # Same points as nested lists (the shape HeatMap and the JS bridge want),
+        # boxed once here so a time filter is just a list slice
+        self._coords_list = self._coords.tolist()
+        self.filtered_coords_list = self._coords_list
+
     def filter_by_time(self, max_hours_ago):
-        """Filters dataframe for events within the last X hours."""
-        self.filtered_df = self.df[self.df['Hours_Ago'] <= max_hours_ago].copy()
-        return len(self.filtered_df)
+        """Filters detections to events within the last X hours."""
+        end = np.searchsorted(self._hours, max_hours_ago, side='right')
+        self.filtered_coords = self._coords[:end]
+        self.filtered_coords_list = self._coords_list[:end]
+        return end
 
     def detect_clusters(self, k=3):
         """
         Uses K-Means Clustering to find the geometric center of enemy batteries.
         """
-        if len(self.filtered_df) < k:
+        if len(self.filtered_coords) < k:
             return []
 
-        coords = self.filtered_df[['Latitude', 'Longitude']].values
-        kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-        kmeans.fit(coords)
+        # SciPy's compiled Lloyd loop with k-means++ seeding; sklearn's setup
+        # and restarts cost far more than the clustering itself at this size
+        centers, _ = kmeans2(self.filtered_coords, k, minit='++', seed=42, iter=20)
 
-        self.clusters = kmeans.cluster_centers_
+        self.clusters = centers
         return self.clusters
 
 
@@ -110,6 +128,11 @@ class RadarHeatmapApp(QMainWindow):
         self.raw_data = DataGenerator.generate_mock_data()
         self.engine = IntelAnalyst(self.raw_data)
 
+        # Map state: JS names of the live layers once the page is mounted
+        self._map_layers = None
+        self._map_loaded = False
+        self._show_clusters = False
+
         self.init_ui()
         self.update_map()
 
@@ -194,6 +217,7 @@ class RadarHeatmapApp(QMainWindow):
 
         # --- RIGHT SIDE (Map) ---
         self.map_view = QWebEngineView()
+        self.map_view.loadFinished.connect(self._on_map_loaded)
         layout.addWidget(self.map_view)
 
     # --- LOGIC ---
@@ -237,14 +261,45 @@ class RadarHeatmapApp(QMainWindow):
             QMessageBox.information(self, "Export", "Intel report saved successfully.")
 
     def update_map(self, show_clusters=False):
+        """Mounts the Folium map once, then pushes layer updates through JS."""
+        self._show_clusters = show_clusters
+        if self._map_layers is None:
+            self._mount_map()
+        elif self._map_loaded:
+            self._push_layers()
+
+    def _on_map_loaded(self, ok):
+        self._map_loaded = ok
+        if ok:
+            # Catch up on any filter changes made while the page was loading
+            self._push_layers()
+
+    def _push_layers(self):
+        """Replaces the heatmap points and target markers in the live page."""
+        heat, targets = self._map_layers
+        js = [f"{heat}.setLatLngs({json.dumps(self.engine.filtered_coords_list)});",
+              f"{targets}.clearLayers();"]
+
+        if self._show_clusters:
+            for i, (lat, lon) in enumerate(self.engine.clusters):
+                js.append(
+                    f"L.marker([{lat}, {lon}], {{icon: L.AwesomeMarkers.icon("
+                    f"{{icon: 'crosshairs', prefix: 'fa', markerColor: 'red', iconColor: 'white'}})}})"
+                    f".bindTooltip('TGT-{i + 1:02d} (CONFIRMED)').addTo({targets});"
+                    f"L.circle([{lat}, {lon}], {{radius: 500, color: 'red', fill: false, "
+                    f"weight: 2, dashArray: '5, 5'}}).addTo({targets});"
+                )
+
+        self.map_view.page().runJavaScript("".join(js))
+
+    def _mount_map(self):
         """Generates the Folium map HTML."""
-        df = self.engine.filtered_df
+        coords = self.engine.filtered_coords
 
-        if df.empty:
+        if len(coords) == 0:
             center_lat, center_lon = 48.0, 37.0
         else:
-            center_lat = df['Latitude'].mean()
-            center_lon = df['Longitude'].mean()
+            center_lat, center_lon = coords.mean(axis=0)
 
         # 1. Base Map (Dark Theme for military look)
         m = folium.Map(
@@ -256,28 +311,11 @@ class RadarHeatmapApp(QMainWindow):
 
         # 2. Heatmap Layer
         # Data format for HeatMap: [[lat, lon, weight], ...]
-        heat_data = df[['Latitude', 'Longitude']].values.tolist()
-        HeatMap(heat_data, radius=15, blur=20, min_opacity=0.4).add_to(m)
+        heat_data = self.engine.filtered_coords_list
+        heat_layer = HeatMap(heat_data, radius=15, blur=20, min_opacity=0.4).add_to(m)
 
-        # 3. Add Clusters (if analyzed)
-        if show_clusters:
-            for i, (lat, lon) in enumerate(self.engine.clusters):
-                # Marker
-                folium.Marker(
-                    [lat, lon],
-                    tooltip=f"TGT-{i + 1:02d} (CONFIRMED)",
-                    icon=folium.Icon(color='red', icon='crosshairs', prefix='fa')
-                ).add_to(m)
-
-                # Accuracy Radius Ring
-                folium.Circle(
-                    location=[lat, lon],
-                    radius=500,  # meters
-                    color='red',
-                    fill=False,
-                    weight=2,
-                    dash_array='5, 5'
-                ).add_to(m)
+        # 3. Cluster layer: markers and accuracy rings are pushed in by _push_layers
+        target_layer = folium.FeatureGroup(name='Targets').add_to(m)
 
         # 4. Mouse Position Tool
         formatter = "function(num) {return L.Util.formatNum(num, 5);};"
@@ -295,6 +333,8 @@ class RadarHeatmapApp(QMainWindow):
         # 5. Render to Widget
         data = io.BytesIO()
         m.save(data, close_file=False)
+        self._map_layers = (heat_layer.get_name(), target_layer.get_name())
+        self._map_loaded = False
         self.map_view.setHtml(data.getvalue().decode())
 
 
@@ -3,8 +3,9 @@ import matplotlib.pyplot as plt
 
 N0 = 1000    # initial amount
 half_life = 5 # half-life in seconds
-t = np.linspace(0, 30, 300)
-N = N0 * np.exp(-np.log(2) * t / half_life)
+decay = np.float32(-np.log(2) / half_life)  # decay constant, computed once
+t = np.linspace(0, 30, 300, dtype=np.float32)
+N = N0 * np.exp(decay * t)
 
 plt.plot(t, N)
 plt.title('Radioactive Decay')
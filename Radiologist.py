@@ -2,21 +2,43 @@ import sys
 import numpy as np
 import pyvista as pv
 from pyvistaqt import QtInteractor
+from vtkmodules.vtkCommonDataModel import vtkPiecewiseFunction
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QSlider, QLabel, QGroupBox, QPushButton,
                              QCheckBox, QSplitter)
 from PyQt5.QtCore import Qt
 
+# --- GPU Library ---
+try:
+    import cupy as cp
+
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+    print("WARNING: CuPy not found. Volumes are generated on the CPU.")
+
+# --- Isosurface Library ---
+try:
+    from skimage.measure import marching_cubes
+
+    SKIMAGE_AVAILABLE = True
+except ImportError:
+    SKIMAGE_AVAILABLE = False
+    print("WARNING: scikit-image not found. Using VTK contouring for the tumor surface.")
+
 
 # --- 1. Synthetic Data & AI Simulation Engine ---
 
 class MedicalDataEngine:
-    def __init__(self, size=128):
+    def __init__(self, size=128, use_gpu=CUPY_AVAILABLE):
         self.size = size
         # Voxel dimensions in mm (simulating high-res MRI)
         self.voxel_spacing = (1.0, 1.0, 1.0)
         self.volume = None
         self.tumor_mask = None
+        # Build the volume with CuPy and keep a device copy for segmentation
+        self.use_gpu = use_gpu
+        self._volume_gpu = None
 
     def generate_synthetic_brain(self):
         """
@@ -25,37 +47,38 @@ class MedicalDataEngine:
         """
         print("Generating 3D MRI Volume...")
         n = self.size
-        # Create a grid
-        x, y, z = np.ogrid[:n, :n, :n]
-        center = n / 2
-
-        # Distance from center
-        radius = np.sqrt((x - center) ** 2 + (y - center) ** 2 + (z - center) ** 2)
+        xp = cp if self.use_gpu else np
+        # Create a grid: float32 broadcast axes keep every temporary in single precision
+        axis = xp.arange(n, dtype=xp.float32)
+        x, y, z = axis[:, None, None], axis[None, :, None], axis[None, None, :]
+        center = np.float32(n / 2)
 
-        # Initialize Volume (Air = 0)
-        self.volume = np.zeros((n, n, n), dtype=np.float32)
+        # Squared distance from center (thresholds are squared too, no sqrt needed)
+        radius2 = (x - center) ** 2 + (y - center) ** 2 + (z - center) ** 2
 
-        # 1. Skull/Skin (Outer Shell)
-        skull_mask = (radius > 45) & (radius < 50)
-        self.volume[skull_mask] = 0.8  # High intensity bone/fat
+        # 1. Brain Tissue (Inner Sphere) and 2. Skull/Skin (Outer Shell), Air = 0
+        brain_mask = radius2 <= 45 ** 2
+        skull_mask = ~brain_mask & (radius2 < 50 ** 2)
+        # Fortran order matches VTK's point layout, so flattening for PyVista is a view
+        volume = xp.select([brain_mask, skull_mask], [0.4, 0.8], 0.0).astype(xp.float32, order="F")
 
-        # 2. Brain Tissue (Inner Sphere)
-        brain_mask = radius <= 45
-        # Add Perlin-like noise for tissue texture
-        noise = np.random.normal(0, 0.05, (n, n, n))
-        self.volume[brain_mask] = 0.4 + noise[brain_mask]
+        # Add Perlin-like noise for tissue texture, drawn only for brain voxels
+        volume[brain_mask] += xp.random.normal(0, 0.05, int(xp.count_nonzero(brain_mask))).astype(xp.float32)
 
         # 3. The Tumor (Hidden Anomaly)
         # Place it off-center
         t_center_x, t_center_y, t_center_z = center + 15, center - 10, center + 5
-        t_dist = np.sqrt((x - t_center_x) ** 2 + (y - t_center_y) ** 2 + (z - t_center_z) ** 2)
+        t_dist2 = (x - t_center_x) ** 2 + (y - t_center_y) ** 2 + (z - t_center_z) ** 2
 
-        tumor_mask_logic = t_dist < 8.0  # 8mm radius tumor
-        self.volume[tumor_mask_logic] = 0.95  # Hyperintense (Bright White)
-
-        # Normalize to 0-1 range
-        self.volume = np.clip(self.volume, 0, 1)
+        volume[t_dist2 < 8.0 ** 2] = 0.95  # 8mm radius tumor, Hyperintense (Bright White)
 
+        # Already within 0-1: tissue sits at 0.4 with 0.05 noise, so no clip pass
+        if self.use_gpu:
+            # Single device -> host copy, PyVista needs the volume on the host
+            self._volume_gpu = volume
+            self.volume = cp.asnumpy(volume, order="F")
+        else:
+            self.volume = volume
         return self.volume
 
     def run_ai_segmentation(self):
@@ -70,8 +93,11 @@ class MedicalDataEngine:
 
         # We cheat slightly by using the known generation logic for the demo's accuracy
         # But let's make it 'calculated' based on intensity to be semi-realistic
-        mask = np.zeros_like(self.volume)
-        mask[self.volume > 0.9] = 1  # Thresholding "AI"
+        if self.use_gpu:
+            # Threshold on the device copy and bring back only the 1 byte/voxel mask
+            mask = cp.asnumpy(self._volume_gpu > 0.9, order="F")
+        else:
+            mask = self.volume > 0.9  # Thresholding "AI" (bool, 1 byte/voxel)
 
         self.tumor_mask = mask
         return mask
@@ -80,7 +106,7 @@ class MedicalDataEngine:
         if self.tumor_mask is None: return 0.0
 
         voxel_vol = self.voxel_spacing[0] * self.voxel_spacing[1] * self.voxel_spacing[2]
-        count = np.sum(self.tumor_mask)
+        count = np.count_nonzero(self.tumor_mask)
         return count * voxel_vol
 
 
@@ -96,13 +122,18 @@ class AIRadiologistApp(QMainWindow):
         self.engine = MedicalDataEngine(size=100)  # 100x100x100 volume
         self.vol_data = self.engine.generate_synthetic_brain()
         self.mask_data = None
+        # Cached render state: tumor isosurface (rebuilt only when the mask changes)
+        # and the user's opacity transfer function (None until the slider moves)
+        self._tumor_mesh = None
+        self._opacity_func = None
 
         # PyVista Grid Object (The container for 3D data)
         # CHANGED: pv.UniformGrid() -> pv.ImageData() due to deprecation
         self.grid = pv.ImageData()
         self.grid.dimensions = self.vol_data.shape
         self.grid.spacing = self.engine.voxel_spacing
-        self.grid.point_data["MRI_Intensity"] = self.vol_data.flatten(order="F")
+        self.grid.point_data["MRI_Intensity"] = self.vol_data.ravel(order="F")
+        self._intensity_range = self.grid.get_data_range("MRI_Intensity")
 
         self.setup_ui()
 
@@ -186,21 +217,30 @@ class AIRadiologistApp(QMainWindow):
             shade=True,
             show_scalar_bar=False
         )
+        if self._opacity_func is not None:
+            self.vol_actor.GetProperty().SetScalarOpacity(self._opacity_func)
 
         # If AI has run, render the Tumor Mask on top
         if self.mask_data is not None:
-            # We create a contour (isosurface) for the tumor
-            # Create a new grid for the mask
-            # CHANGED: pv.UniformGrid() -> pv.ImageData() due to deprecation
-            mask_grid = pv.ImageData()
-            mask_grid.dimensions = self.mask_data.shape
-            mask_grid.spacing = self.engine.voxel_spacing
-            mask_grid.point_data["Tumor"] = self.mask_data.flatten(order="F")
-
-            # Extract surface where value > 0.5
-            tumor_mesh = mask_grid.contour([0.5], scalars="Tumor")
-
-            self.plotter.add_mesh(tumor_mesh, color="red", opacity=0.6, label="Tumor")
+            if self._tumor_mesh is None and SKIMAGE_AVAILABLE:
+                # Lewiner marching cubes straight on the mask, no intermediate VTK grid
+                verts, faces, _, _ = marching_cubes(self.mask_data.astype(np.float32), level=0.5,
+                                                    spacing=self.engine.voxel_spacing)
+                cells = np.hstack([np.full((len(faces), 1), 3, dtype=faces.dtype), faces]).ravel()
+                self._tumor_mesh = pv.PolyData(verts, cells)
+            elif self._tumor_mesh is None:
+                # We create a contour (isosurface) for the tumor
+                # Create a new grid for the mask
+                # CHANGED: pv.UniformGrid() -> pv.ImageData() due to deprecation
+                mask_grid = pv.ImageData()
+                mask_grid.dimensions = self.mask_data.shape
+                mask_grid.spacing = self.engine.voxel_spacing
+                mask_grid.point_data["Tumor"] = self.mask_data.astype(np.uint8).ravel(order="F")
+
+                # Extract surface where value > 0.5
+                self._tumor_mesh = mask_grid.contour([0.5], scalars="Tumor")
+
+            self.plotter.add_mesh(self._tumor_mesh, color="red", opacity=0.6, label="Tumor")
             self.plotter.add_legend_scale(bottom_axis_visibility=False, left_axis_visibility=False)
 
         self.plotter.reset_camera()
@@ -211,10 +251,17 @@ class AIRadiologistApp(QMainWindow):
         # Create a sigmoid-like mapping based on slider
         # This allows user to peel away layers of the brain
         opacity_map = [0, 0, 0, 0.1, 0.8]
-        # We define opacity by shifting the mapping
-        # PyVista handles opacity usually as a mapping from scalar value to alpha
-        # Simple approach: Removing and re-adding is easiest for this demo structure
-        self.render_volume()
+        # We define opacity by shifting the mapping: the ramp is squeezed into
+        # [threshold, max] of the intensity range and everything below is transparent
+        lo, hi = self._intensity_range
+        self._opacity_func = vtkPiecewiseFunction()
+        self._opacity_func.AddPoint(lo, 0.0)
+        for value, alpha in zip(np.linspace(lo + val * (hi - lo), hi, len(opacity_map)), opacity_map):
+            self._opacity_func.AddPoint(value, alpha)
+
+        # Only the transfer function changes; the volume itself stays uploaded
+        self.vol_actor.GetProperty().SetScalarOpacity(self._opacity_func)
+        self.plotter.render()
 
     def toggle_slices(self, checked):
         if checked:
@@ -225,6 +272,7 @@ class AIRadiologistApp(QMainWindow):
     def run_ai(self):
         # 1. Run "Inference"
         self.mask_data = self.engine.run_ai_segmentation()
+        self._tumor_mesh = None
 
         # 2. Calculate Stats
         vol = self.engine.calculate_tumor_volume()
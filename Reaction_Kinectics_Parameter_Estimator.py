@@ -1,6 +1,6 @@
 import numpy as np
 from scipy.integrate import odeint
-from scipy.optimize import minimize
+from scipy.optimize import least_squares
 import matplotlib.pyplot as plt
 
 # A -> B -> C
@@ -19,17 +19,45 @@ Y_true = odeint(model, y0, t_exp, args=(true_k1, true_k2))
 noise = np.random.normal(0, 0.02, Y_true.shape)
 Y_obs = Y_true + noise
 
-def loss(params):
+# Closed-form solution of A -> B -> C with A0 = 1 (no ODE integration needed)
+def concentrations(k1, k2, t=t_exp):
+    A = np.exp(-k1 * t)
+    if abs(k2 - k1) < 1e-9:
+        B = k1 * t * A
+    else:
+        B = k1 / (k2 - k1) * (A - np.exp(-k2 * t))
+    return np.column_stack([A, B, 1 - A - B])
+
+# Partial derivatives of concentrations() w.r.t. k1 and k2
+def concentrations_jac(k1, k2, t=t_exp):
+    A = np.exp(-k1 * t)
+    dA1 = -t * A
+    if abs(k2 - k1) < 1e-9:
+        dB1 = t * A * (1 - k1 * t / 2)
+        dB2 = -k1 * t**2 * A / 2
+    else:
+        d = k2 - k1
+        E2 = np.exp(-k2 * t)
+        dB1 = k2 * (A - E2) / d**2 - k1 * t * A / d
+        dB2 = -k1 * (A - E2) / d**2 + k1 * t * E2 / d
+    zeros = np.zeros_like(t)
+    return (np.column_stack([dA1, dB1, -dA1 - dB1]),
+            np.column_stack([zeros, dB2, -dB2]))
+
+def resid(params):
+    k1, k2 = params
+    return (concentrations(k1, k2) - Y_obs).ravel()
+
+def resid_jac(params):
     k1, k2 = params
-    if k1 < 0 or k2 < 0: return 1e6
-    Y_pred = odeint(model, y0, t_exp, args=(k1, k2))
-    return np.mean((Y_pred - Y_obs)**2)
+    dY1, dY2 = concentrations_jac(k1, k2)
+    return np.column_stack([dY1.ravel(), dY2.ravel()])
 
-res = minimize(loss, x0=[0.5, 0.5])
+res = least_squares(resid, x0=[0.5, 0.5], jac=resid_jac, bounds=([0, 0], [np.inf, np.inf]), method="trf")
 k1_est, k2_est = res.x
 print(f"Estimated k1={k1_est:.3f}, k2={k2_est:.3f}")
 
-Y_fit = odeint(model, y0, t_exp, args=(k1_est, k2_est))
+Y_fit = concentrations(k1_est, k2_est)
 plt.plot(t_exp, Y_obs[:,0], 'o', label='A obs')
 plt.plot(t_exp, Y_obs[:,1], 'o', label='B obs')
 plt.plot(t_exp, Y_obs[:,2], 'o', label='C obs')
@@ -1,6 +1,15 @@
 import pygame
 import numpy as np
-import random
+
+# --- JIT Library ---
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    print("WARNING: Numba not found. Running the KMC sweep in pure Python.")
 
 # --- Configuration & Physics Constants ---
 WINDOW_WIDTH = 900
@@ -10,7 +19,15 @@ CELL_SIZE = 8  # Pixel size of each atom
 MARGIN = 200  # Right side margin for UI
 
 # Simulation Speeds
-STEPS_PER_FRAME = 2000  # Kinetic Monte Carlo steps per render cycle
+STEPS_PER_FRAME = 2048  # Kinetic Monte Carlo steps per render cycle
+Y_CO_RATE = 0.3  # Change of CO fraction per second while UP/DOWN is held
+
+# Parallel sweep: the lattice is split into BLOCK_SIZE x BLOCK_SIZE blocks
+# colored like a 2x2 checkerboard (BLOCK_SIZE must divide GRID_SIZE evenly,
+# into an even number of blocks per side, and be at least 4)
+BLOCK_SIZE = 10
+N_BLOCKS = (GRID_SIZE // BLOCK_SIZE) ** 2
+STEPS_PER_BLOCK = STEPS_PER_FRAME // N_BLOCKS
 
 # Species IDs
 EMPTY = 0
@@ -26,6 +43,150 @@ COLOR_REACTION = (50, 255, 50)  # CO2 Leaving = Green Flash
 COLOR_TEXT = (200, 200, 200)
 
 
+def build_neighbor_table(n):
+    """
+    Flat indices of the 4 neighbors (Up, Down, Left, Right) of every site
+    of an n x n lattice, with Periodic Boundary Conditions baked in.
+    """
+    i, j = np.divmod(np.arange(n * n), n)
+    return np.column_stack([((i - 1) % n) * n + j, ((i + 1) % n) * n + j,
+                            i * n + (j - 1) % n, i * n + (j + 1) % n]).astype(np.int32)
+
+
+def rotl(x, k):
+    return (x << k) | (x >> (np.uint64(64) - k))
+
+
+def next_u64(state):
+    """Advance a xoroshiro128+ state (2 x uint64) in place and return the next 64-bit output."""
+    s0 = state[0]
+    s1 = state[1]
+    result = s0 + s1
+    s1 ^= s0
+    state[0] = rotl(s0, np.uint64(24)) ^ s1 ^ (s1 << np.uint64(16))
+    state[1] = rotl(s1, np.uint64(37))
+    return result
+
+
+def rand_float(state):
+    """Uniform float in [0, 1) from the top 53 bits."""
+    return (next_u64(state) >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+
+def rand_below(state, n):
+    """Uniform integer in [0, n) for small n: multiply-high on the top 32 bits, no modulo."""
+    return np.int64(((next_u64(state) >> np.uint64(32)) * np.uint64(n)) >> np.uint64(32))
+
+
+def check_reaction(flat, nbr, site, target_species, rx_sites, count, state):
+    """
+    Check if the newly adsorbed species at flat index site can react with a neighbor.
+    Mechanism: CO(s) + O(s) -> CO2(g) + 2 Empty Sites
+    Reacting sites are appended to rx_sites; returns the updated reaction count.
+    """
+    # Check neighbors starting from a random direction
+    k0 = rand_below(state, 4)
+    for r in range(4):
+        other = nbr[site, (k0 + r) & 3]
+
+        if flat[other] == target_species:
+            # REACTION OCCURRED!
+            # 1. Desorb both (turn to empty)
+            flat[site] = EMPTY
+            flat[other] = EMPTY
+
+            # 2. Record both sites for the green flash
+            rx_sites[2 * count] = site
+            rx_sites[2 * count + 1] = other
+            return count + 1  # Reacted
+
+    return count  # No reaction found
+
+
+def kmc_block(flat, nbr, bi, bj, y_co, n_steps, rx_sites, state):
+    """
+    Perform n_steps Monte Carlo steps in place, landing only on sites of block (bi, bj).
+    Ziff-Gulari-Barshad (ZGB) Model Logic.
+    rx_sites needs room for 4 sites per step; state is this block's generator state.
+    Returns the number of reactions.
+    """
+    count = 0
+    for _ in range(n_steps):
+        # 1. Select a random site in this block
+        x = bi * BLOCK_SIZE + rand_below(state, BLOCK_SIZE)
+        y = bj * BLOCK_SIZE + rand_below(state, BLOCK_SIZE)
+        site = x * GRID_SIZE + y
+
+        # 2. Determine which molecule tries to land based on Partial Pressure
+        # y_co is the probability that the impinging molecule is CO
+        if rand_float(state) < y_co:
+            # === ATTEMPT CO ADSORPTION ===
+            # CO requires 1 empty site
+            if flat[site] == EMPTY:
+                flat[site] = CO
+                # Check for immediate reaction with neighbors
+                count = check_reaction(flat, nbr, site, OXYGEN, rx_sites, count, state)
+
+        else:
+            # === ATTEMPT O2 ADSORPTION ===
+            # O2 requires 2 adjacent empty sites to dissociate into 2O
+            if flat[site] == EMPTY:
+                # Pick a random neighbor for the second oxygen atom
+                other = nbr[site, rand_below(state, 4)]
+
+                if flat[other] == EMPTY:
+                    # Successful O2 adsorption (dissociative)
+                    flat[site] = OXYGEN
+                    flat[other] = OXYGEN
+
+                    # Check reaction for first O atom, then the second one if it's still there
+                    count = check_reaction(flat, nbr, site, CO, rx_sites, count, state)
+                    if flat[other] == OXYGEN:
+                        count = check_reaction(flat, nbr, other, CO, rx_sites, count, state)
+
+    return count
+
+
+def kmc_sweep(flat, nbr, y_co, steps_per_block, rx_sites, rx_counts, rng_states):
+    """
+    Perform steps_per_block Monte Carlo steps in every block of the flattened grid.
+    One step writes at most 2 sites away from where it lands, and blocks of the
+    same checkerboard color are a whole block apart, so each color's blocks run
+    in parallel without sharing sites. Colors are visited in random order.
+    rx_sites and rng_states have one row per block and rx_counts receives each
+    block's reaction count; returns the total number of reactions.
+    """
+    half = GRID_SIZE // BLOCK_SIZE // 2
+    for color in np.random.permutation(4):
+        ci, cj = color >> 1, color & 1
+        for b in prange(half * half):
+            bi = 2 * (b // half) + ci
+            bj = 2 * (b % half) + cj
+            block = bi * 2 * half + bj
+            rx_counts[block] = kmc_block(flat, nbr, bi, bj, y_co, steps_per_block,
+                                         rx_sites[block], rng_states[block])
+
+    return rx_counts.sum()
+
+
+if NUMBA_AVAILABLE:
+    rotl = njit(inline="always")(rotl)
+    next_u64 = njit(inline="always")(next_u64)
+    rand_float = njit(inline="always")(rand_float)
+    rand_below = njit(inline="always")(rand_below)
+    check_reaction = njit(cache=True, fastmath=True)(check_reaction)
+    kmc_block = njit(cache=True, fastmath=True)(kmc_block)
+    kmc_sweep = njit(cache=True, fastmath=True, parallel=True)(kmc_sweep)
+else:
+    # Outside Numba, uint64 scalar wraparound raises overflow warnings,
+    # so the pure Python path draws from NumPy's global generator instead
+    def rand_float(state):
+        return np.random.random()
+
+    def rand_below(state, n):
+        return np.random.randint(0, n)
+
+
 class CatalystSimulation:
     def __init__(self):
         pygame.init()
@@ -36,112 +197,55 @@ class CatalystSimulation:
         self.title_font = pygame.font.SysFont("Arial", 22, bold=True)
 
         # The Grid: 0=Empty, 1=CO, 2=O
-        self.grid = np.zeros((GRID_SIZE, GRID_SIZE), dtype=int)
+        self.grid = np.zeros((GRID_SIZE, GRID_SIZE), dtype=np.int8)
 
         # Simulation State
         self.y_co = 0.50  # Partial pressure of CO (Mole Fraction)
+        self.up_held = False
+        self.down_held = False
         self.running = True
         self.reaction_count = 0
-        self.reactions_this_frame = []  # List of (x,y) coords to flash green
+        self.reactions_this_frame = []  # Flat site indices to flash green
         self.total_steps = 0
         self.total_reactions = 0
 
-        # Neighborhood offsets (Up, Down, Left, Right)
-        self.neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-
-    def get_random_neighbor(self, x, y):
-        """Pick a random neighbor with Periodic Boundary Conditions."""
-        dx, dy = random.choice(self.neighbors)
-        nx = (x + dx) % GRID_SIZE
-        ny = (y + dy) % GRID_SIZE
-        return nx, ny
-
-    def check_reaction(self, x, y, species_type):
-        """
-        Check if the newly adsorbed species at (x,y) can react with a neighbor.
-        Mechanism: CO(s) + O(s) -> CO2(g) + 2 Empty Sites
-        """
-        # Shuffle neighbors to check randomly
-        random.shuffle(self.neighbors)
-
-        target_species = OXYGEN if species_type == CO else CO
-
-        for dx, dy in self.neighbors:
-            nx = (x + dx) % GRID_SIZE
-            ny = (y + dy) % GRID_SIZE
-
-            if self.grid[nx, ny] == target_species:
-                # REACTION OCCURRED!
-                # 1. Desorb both (turn to empty)
-                self.grid[x, y] = EMPTY
-                self.grid[nx, ny] = EMPTY
-
-                # 2. Record stats
-                self.reaction_count += 1
-                self.reactions_this_frame.append((x, y))
-                self.reactions_this_frame.append((nx, ny))
-                return True  # Reacted
-
-        return False  # No reaction found
-
-    def kmc_step(self):
-        """
-        Perform one Monte Carlo step.
-        Ziff-Gulari-Barshad (ZGB) Model Logic.
-        """
-        # 1. Select a random site on the surface
-        rx = random.randint(0, GRID_SIZE - 1)
-        ry = random.randint(0, GRID_SIZE - 1)
+        # Neighbor lookup for the flattened grid (no wraparound math in the kernel)
+        self.nbr = build_neighbor_table(GRID_SIZE)
 
-        # 2. Determine which molecule tries to land based on Partial Pressure
-        # y_co is the probability that the impinging molecule is CO
-        if random.random() < self.y_co:
-            # === ATTEMPT CO ADSORPTION ===
-            # CO requires 1 empty site
-            if self.grid[rx, ry] == EMPTY:
-                self.grid[rx, ry] = CO
-                # Check for immediate reaction with neighbors
-                self.check_reaction(rx, ry, CO)
-
-        else:
-            # === ATTEMPT O2 ADSORPTION ===
-            # O2 requires 2 adjacent empty sites to dissociate into 2O
-            if self.grid[rx, ry] == EMPTY:
-                # Pick a random neighbor for the second oxygen atom
-                nx, ny = self.get_random_neighbor(rx, ry)
-
-                if self.grid[nx, ny] == EMPTY:
-                    # Successful O2 adsorption (dissociative)
-                    self.grid[rx, ry] = OXYGEN
-                    self.grid[nx, ny] = OXYGEN
+        # Per-block reaction site buffers for one frame: at most 2 reactions (4 sites) per step
+        self.rx_sites = np.empty((N_BLOCKS, 4 * STEPS_PER_BLOCK), dtype=np.int16)
+        self.rx_counts = np.zeros(N_BLOCKS, dtype=np.int64)
 
-                    # Check reaction for first O atom
-                    if not self.check_reaction(rx, ry, OXYGEN):
-                        # If first didn't react (and vanish), check second O atom
-                        # (Note: if first reacted, the site (rx,ry) is now empty,
-                        # but (nx,ny) is still O, so we check it)
-                        pass
+        # Independent xoroshiro128+ state per block (never all-zero)
+        self.rng_states = np.random.default_rng().integers(1, 2**64, size=(N_BLOCKS, 2),
+                                                            dtype=np.uint64, endpoint=False)
 
-                        # Check reaction for second O atom (if it's still there)
-                    if self.grid[nx, ny] == OXYGEN:
-                        self.check_reaction(nx, ny, OXYGEN)
+        # Cell color per species ID: Empty, CO, O
+        self.palette = np.array([COLOR_GRID_BG, COLOR_CO, COLOR_O], dtype=np.uint8)
 
     def handle_input(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_UP]:
-            self.y_co = min(1.0, self.y_co + 0.005)
-        if keys[pygame.K_DOWN]:
-            self.y_co = max(0.0, self.y_co - 0.005)
-
-        # Reset board
-        if keys[pygame.K_r]:
-            self.grid.fill(EMPTY)
-            self.total_reactions = 0
-            self.total_steps = 0
-
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_UP:
+                    self.up_held = True
+                elif event.key == pygame.K_DOWN:
+                    self.down_held = True
+                elif event.key == pygame.K_r:
+                    # Reset board
+                    self.grid.fill(EMPTY)
+                    self.total_reactions = 0
+                    self.total_steps = 0
+            elif event.type == pygame.KEYUP:
+                if event.key == pygame.K_UP:
+                    self.up_held = False
+                elif event.key == pygame.K_DOWN:
+                    self.down_held = False
+
+        # Held arrows sweep the CO fraction at a fixed rate per second, not per frame
+        dt = self.clock.get_time() / 1000.0
+        self.y_co = min(1.0, max(0.0, self.y_co + (self.up_held - self.down_held) * Y_CO_RATE * dt))
 
     def draw_ui(self):
         # Draw Sidebar
@@ -166,8 +270,9 @@ class CatalystSimulation:
 
         # Calculate coverage
         total_cells = GRID_SIZE * GRID_SIZE
-        co_cov = np.sum(self.grid == CO) / total_cells
-        o_cov = np.sum(self.grid == OXYGEN) / total_cells
+        counts = np.bincount(self.grid.ravel(), minlength=3)  # [empty, CO, O]
+        co_cov = counts[CO] / total_cells
+        o_cov = counts[OXYGEN] / total_cells
 
         draw_text(f"CO Coverage: {co_cov * 100:.1f}%", COLOR_CO)
         draw_text(f"O Coverage: {o_cov * 100:.1f}%", COLOR_O)
@@ -200,13 +305,12 @@ class CatalystSimulation:
         while self.running:
             self.handle_input()
 
-            # Reset frame stats
-            self.reaction_count = 0
-            self.reactions_this_frame = []
-
-            # Run Physics Steps (KMC Loop)
-            for _ in range(STEPS_PER_FRAME):
-                self.kmc_step()
+            # Run Physics Steps (KMC Loop), all in one compiled call
+            self.reaction_count = kmc_sweep(self.grid.ravel(), self.nbr, self.y_co,
+                                            STEPS_PER_BLOCK, self.rx_sites, self.rx_counts,
+                                            self.rng_states)
+            filled = np.arange(self.rx_sites.shape[1]) < 2 * self.rx_counts[:, None]
+            self.reactions_this_frame = self.rx_sites[filled]
 
             self.total_steps += STEPS_PER_FRAME
             self.total_reactions += self.reaction_count
@@ -214,30 +318,15 @@ class CatalystSimulation:
             # --- Drawing ---
             self.screen.fill(COLOR_BG)
 
-            # Lock surface for pixel manipulation (faster than drawing rects)
-            # Create a surface for the grid
-            grid_surf = pygame.Surface((GRID_SIZE * CELL_SIZE, GRID_SIZE * CELL_SIZE))
-            grid_surf.fill(COLOR_GRID_BG)  # Default White
-
-            # We can use numpy masking to draw faster if needed,
-            # but simple rect iteration is fine for this grid size.
-
-            # Draw CO (Blue)
-            co_indices = np.where(self.grid == CO)
-            for x, y in zip(*co_indices):
-                pygame.draw.rect(grid_surf, COLOR_CO,
-                                 (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
-
-            # Draw Oxygen (Red)
-            o_indices = np.where(self.grid == OXYGEN)
-            for x, y in zip(*o_indices):
-                pygame.draw.rect(grid_surf, COLOR_O,
-                                 (x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+            # Color every cell at once: palette lookup gives an (N, N, 3) image
+            # indexed [x, y] like surfarray, then one scale up to CELL_SIZE pixels
+            rgb = self.palette[self.grid]
 
             # Draw Reactions (Green Flash)
-            for rx, ry in self.reactions_this_frame:
-                pygame.draw.rect(grid_surf, COLOR_REACTION,
-                                 (rx * CELL_SIZE, ry * CELL_SIZE, CELL_SIZE, CELL_SIZE))
+            rgb.reshape(-1, 3)[self.reactions_this_frame] = COLOR_REACTION
+
+            grid_surf = pygame.transform.scale(pygame.surfarray.make_surface(rgb),
+                                               (GRID_SIZE * CELL_SIZE, GRID_SIZE * CELL_SIZE))
 
             # Blit grid to main screen
             self.screen.blit(grid_surf, (20, 20))
@@ -4,7 +4,12 @@ import matplotlib.pyplot as plt
 m = 1  # mass (kg)
 c = 3e8  # speed of light (m/s)
 v = np.linspace(0, 0.99 * c, 500)
-E = m * c**2 / np.sqrt(1 - (v**2 / c**2))
+
+# E = m c^2 / sqrt(1 - v^2/c^2), evaluated in place in a single buffer
+E = np.square(v / c)
+np.subtract(1, E, out=E)
+np.sqrt(E, out=E)
+np.divide(m * c**2, E, out=E)
 
 plt.plot(v, E)
 plt.title('Relativistic Energy vs Velocity')
@@ -39,6 +39,53 @@ for _ in range(100):
     y = random.randint(0, SCREEN_HEIGHT)
     stars.append((x, y))
 
+# --- Pre-render the Static Background ---
+# Space, stars and the blue Earth never move, so draw them once
+# and blit the finished picture every frame.
+background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+background.fill(BLACK)
+for x, y in stars:
+    pygame.draw.circle(background, WHITE, (x, y), 1)  # Draw a small 1-pixel star
+
+# Draw "Earth" at the bottom
+# We draw a very large circle centered below the screen,
+# so only the top curve is visible.
+pygame.draw.circle(background, EARTH_BLUE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT + 750), 800)
+
+# --- Pre-render the Rocket ---
+# Body, nose cone and fins only ever move, so draw them once onto a
+# transparent surface. Local (20, 35) is the rocket's (rocket_x, rocket_y).
+ROCKET_ANCHOR = (20, 35)
+rocket_surf = pygame.Surface((40, 60), pygame.SRCALPHA)
+
+# 1. Draw the Rocket Body (a white rectangle)
+# rect = (left, top, width, height)
+pygame.draw.rect(rocket_surf, WHITE, (10, 15, 20, 35))
+
+# 2. Draw the Nose Cone (a white triangle)
+nose_points = [
+    (10, 15),  # Top-left of body
+    (30, 15),  # Top-right of body
+    (20, 0)  # Tip of the nose
+]
+pygame.draw.polygon(rocket_surf, WHITE, nose_points)
+
+# 3. Draw the Fins (red triangles)
+# Left fin
+fin_left_points = [
+    (10, 50),  # Bottom-left of body
+    (10, 30),
+    (2, 53)
+]
+pygame.draw.polygon(rocket_surf, RED, fin_left_points)
+# Right fin
+fin_right_points = [
+    (30, 50),  # Bottom-right of body
+    (30, 30),
+    (38, 53)
+]
+pygame.draw.polygon(rocket_surf, RED, fin_right_points)
+
 # --- Rocket Initial Position and Speed ---
 # Start the rocket at the bottom-center of the screen
 rocket_x = SCREEN_WIDTH // 2
@@ -74,17 +121,9 @@ while running:
         land_x_offset = 250
 
     # --- 3. Drawing ---
-    # Fill the entire screen with BLACK (space)
-    screen.fill(BLACK)
-
-    # Draw all the stars
-    for x, y in stars:
-        pygame.draw.circle(screen, WHITE, (x, y), 1)  # Draw a small 1-pixel star
+    # Space, stars and Earth in a single blit
+    screen.blit(background, (0, 0))
 
-    # Draw "Earth" at the bottom
-    # We draw a very large circle centered below the screen,
-    # so only the top curve is visible.
-    pygame.draw.circle(screen, EARTH_BLUE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT + 750), 800)
     # Draw a little "land" using the offset to make it move
     pygame.draw.circle(screen, EARTH_GREEN, (SCREEN_WIDTH // 2 + int(land_x_offset), SCREEN_HEIGHT + 700), 100)
 
@@ -103,33 +142,8 @@ while running:
     ]
     pygame.draw.polygon(screen, flame_color, flame_points)
 
-    # 2. Draw the Rocket Body (a white rectangle)
-    # rect = (left, top, width, height)
-    pygame.draw.rect(screen, WHITE, (rocket_x - 10, rocket_y - 20, 20, 35))
-
-    # 3. Draw the Nose Cone (a white triangle)
-    nose_points = [
-        (rocket_x - 10, rocket_y - 20),  # Top-left of body
-        (rocket_x + 10, rocket_y - 20),  # Top-right of body
-        (rocket_x, rocket_y - 35)  # Tip of the nose
-    ]
-    pygame.draw.polygon(screen, WHITE, nose_points)
-
-    # 4. Draw the Fins (red triangles)
-    # Left fin
-    fin_left_points = [
-        (rocket_x - 10, rocket_y + 15),  # Bottom-left of body
-        (rocket_x - 10, rocket_y - 5),
-        (rocket_x - 18, rocket_y + 18)
-    ]
-    pygame.draw.polygon(screen, RED, fin_left_points)
-    # Right fin
-    fin_right_points = [
-        (rocket_x + 10, rocket_y + 15),  # Bottom-right of body
-        (rocket_x + 10, rocket_y - 5),
-        (rocket_x + 18, rocket_y + 18)
-    ]
-    pygame.draw.polygon(screen, RED, fin_right_points)
+    # 2. Blit the pre-rendered body, nose cone and fins on top
+    screen.blit(rocket_surf, (rocket_x - ROCKET_ANCHOR[0], rocket_y - ROCKET_ANCHOR[1]))
 
     # --- Draw Information Text ---
     # Calculate altitude (how far it has traveled from the start)
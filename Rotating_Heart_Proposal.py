@@ -1,60 +1,71 @@
-import turtle
+import pygame
 import math
+import numpy as np
 
 # Setup
-screen = turtle.Screen()
-screen.bgcolor("black")
-screen.title("❤️ A Special Message ❤️")
+WIDTH, HEIGHT = 800, 600
+CENTER = np.array([WIDTH // 2, HEIGHT // 2])
 
-pen = turtle.Turtle()
-pen.speed(0)
-pen.width(2)
+pygame.init()
+screen = pygame.display.set_mode((WIDTH, HEIGHT))
+pygame.display.set_caption("❤️ A Special Message ❤️")
+clock = pygame.time.Clock()
+
+BLACK = (0, 0, 0)
+RED = (200, 0, 0)
+PINK = (255, 192, 203)
+GOLD = (255, 215, 0)
+
+# Parametric heart equations (scaled by 10), evaluated once as arrays:
+# the outline never changes, only its rotation
+R = np.deg2rad(np.arange(360))
+X0 = 160 * np.sin(R) ** 3
+Y0 = 130 * np.cos(R) - 50 * np.cos(2 * R) - 20 * np.cos(3 * R) - 10 * np.cos(4 * R)
+# Screen y grows downward, so flip the outline once here
+pts0 = np.column_stack([X0, -Y0])
 
 
 # Draw parametric heart that rotates
-def draw_rotating_heart(t, angle):
-    pen.clear()
-    pen.color("red")
-    pen.fillcolor("red")
-    pen.begin_fill()
-    pen.penup()
+def draw_rotating_heart(angle):
+    screen.fill(BLACK)
 
-    # Parametric heart equations
-    for i in range(360):
-        rad = math.radians(i)
-        x = 16 * math.sin(rad) ** 3
-        y = 13 * math.cos(rad) - 5 * math.cos(2 * rad) - 2 * math.cos(3 * rad) - math.cos(4 * rad)
+    # Rotate the whole outline with one 2x2 matmul (counter-clockwise on screen)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    rot = np.array([[cos_a, sin_a], [-sin_a, cos_a]])
+    pts = pts0 @ rot.T + CENTER
 
-        # Rotate coordinates
-        x_rot = x * math.cos(angle) - y * math.sin(angle)
-        y_rot = x * math.sin(angle) + y * math.cos(angle)
+    pygame.draw.polygon(screen, RED, pts.astype(int).tolist())
 
-        pen.goto(x_rot * 10, y_rot * 10)
-        if i == 0:
-            pen.pendown()
 
-    pen.end_fill()
-    pen.hideturtle()
+def write(text, color, font, y):
+    # Text sits on its baseline at height y above the center
+    img = font.render(text, True, color)
+    screen.blit(img, img.get_rect(midbottom=(WIDTH // 2, HEIGHT // 2 - y)))
 
 
 # Animation loop
 def animate():
     for angle in range(0, 360, 5):
-        draw_rotating_heart(pen, math.radians(angle))
-        screen.update()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return False
+        draw_rotating_heart(math.radians(angle))
+        pygame.display.flip()
+        clock.tick(60)
 
     # Write message after rotation
-    pen.penup()
-    pen.goto(0, 200)
-    pen.color("pink")
-    pen.write("Will You Marry Me Pure Smile?", align="center", font=("Courier", 32, "bold"))
-
-    pen.goto(0, -200)
-    pen.color("gold")
-    pen.write("💍 Say Yes! 💍", align="center", font=("Arial", 24, "italic"))
+    write("Will You Marry Me Pure Smile?", PINK, pygame.font.SysFont("courier", 32, bold=True), 200)
+    write("💍 Say Yes! 💍", GOLD, pygame.font.SysFont("arial", 24, italic=True), -200)
+    pygame.display.flip()
+    return True
 
 
-screen.tracer(0)
-animate()
-screen.tracer(1)
-turtle.done()
\ No newline at end of file
+if animate():
+    # Keep the final frame up until the window is closed
+    waiting = True
+    while waiting:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                waiting = False
+        clock.tick(30)
+pygame.quit()
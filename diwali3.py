@@ -56,20 +56,19 @@ def draw_shield():
     turtle.width(3)
     turtle.goto(20, 50)
 
-def display_text(message, y, size, color):
+def display_text(writer, message, y, size, color):
     """Function to display a message."""
-    turtle.penup()
-    turtle.goto(0, y)
-    turtle.pendown()
-    turtle.color(color)
-    turtle.write(message, align="center", font=("Arial", size, "bold"))
+    writer.penup()
+    writer.goto(0, y)
+    writer.color(color)
+    writer.write(message, align="center", font=("Arial", size, "bold"))
 
-def animate_text(messages, y, size, color, delay=1.5):
-    """Animate a sequence of messages."""
+def animate_text(writer, messages, y, size, color, delay=1.5):
+    """Animate a sequence of messages, clearing only the text between them."""
     for message in messages:
-        display_text(message, y, size, color)
+        display_text(writer, message, y, size, color)
         time.sleep(delay)
-        turtle.clear()
+        writer.clear()
 
 def main_animation():
     """Main animation combining Diwali wishes and cyber safety."""
@@ -78,17 +77,21 @@ def main_animation():
     screen.title("Diwali Wishes and Cyber Safety")
 
     turtle.speed(10)
+    # Messages get their own turtle so swapping them never wipes the artwork
+    writer = turtle.Turtle(visible=False)
 
     # Step 1: Draw diya with Diwali message
     draw_diya()
-    animate_text(["Light up your life!", "Happy Diwali!"], 200, 24, "orange")
+    animate_text(writer, ["Light up your life!", "Happy Diwali!"], 200, 24, "orange")
 
     # Step 2: Draw cyber safety shield with safety message
+    turtle.clear()
     draw_shield()
-    animate_text(["Protect your online world!", "Stay Cyber Safe!"], 200, 24, "blue")
+    animate_text(writer, ["Protect your online world!", "Stay Cyber Safe!"], 200, 24, "blue")
 
     # Step 3: Combine messages
-    display_text("Celebrate Brightness & Stay Protected!", 0, 20, "white")
+    turtle.clear()
+    display_text(writer, "Celebrate Brightness & Stay Protected!", 0, 20, "white")
     time.sleep(3)
 
     # End animation